@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
+from collections import defaultdict
 from typing import List, Dict, Any
 
 # Add project root to path
@@ -17,9 +18,38 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from mcp_servers.universal_backtest_engine import handle_bulk_backtest
-from shared.strategy_registry import StrategyRegistry
+from shared.strategy_registry import get_strategy_registry
 from mcp_servers.universal_backtest_engine import UniversalBacktestEngine
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+
+
+def _split_log_line(line: str):
+    """
+    Split a fixed-format live log line by index arithmetic.
+    
+    Lines look like ``[YYYY-MM-DD HH:MM:SS] EVENT - SYMBOL (id) - WORD @ PRICE...``.
+    
+    Returns:
+        (timestamp, symbol, word, tail) or None if the line doesn't match the format
+    """
+    if line[:1] != '[' or line[20:21] != ']':
+        return None
+    
+    idx1 = line.find(' - ', 22)
+    if idx1 < 0:
+        return None
+    idx2 = line.find(' (', idx1)
+    if idx2 < 0:
+        return None
+    idx3 = line.find(') - ', idx2)
+    if idx3 < 0:
+        return None
+    at = line.find(' @ ', idx3)
+    if at < 0:
+        return None
+    
+    timestamp = datetime.strptime(line[1:20], '%Y-%m-%d %H:%M:%S')
+    return timestamp, line[idx1 + 3:idx2], line[idx3 + 4:at].strip(), line[at + 3:]
 
 
 def parse_live_signals(log_text: str) -> List[Dict[str, Any]]:
@@ -33,66 +63,48 @@ def parse_live_signals(log_text: str) -> List[Dict[str, Any]]:
         List of trade dictionaries with timestamp, symbol, direction, price
     """
     trades = []
+    # Indices of still-open trades per symbol, most recent last
+    open_stack: Dict[str, List[int]] = defaultdict(list)
     
     for line in log_text.strip().split('\n'):
         if '✅ TRADE ENTERED' in line:
             # Example: [2025-12-19 08:44:00] ✅ TRADE ENTERED - NAS100 (205) - Sell @ 25131.80
-            parts = line.split(']', 1)
-            if len(parts) < 2:
+            parsed = _split_log_line(line)
+            if parsed is None:
                 continue
-                
-            timestamp_str = parts[0].strip('[')
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
             
-            rest = parts[1].strip()
-            # Extract symbol, direction, and price
-            if '-' in rest:
-                components = [c.strip() for c in rest.split('-')]
-                if len(components) >= 4:
-                    symbol_part = components[1]  # "NAS100 (205)"
-                    symbol = symbol_part.split('(')[0].strip()
-                    
-                    direction = components[2].strip()  # "Sell"
-                    
-                    price_part = components[3].split('@')[1].strip()  # "25131.80"
-                    price = float(price_part)
-                    
-                    trades.append({
-                        'timestamp': timestamp,
-                        'symbol': f"{symbol}_SB",  # Add _SB suffix for backtest comparison
-                        'direction': direction.upper(),
-                        'price': price
-                    })
+            timestamp, symbol, direction, tail = parsed
+            price = float(tail.split(None, 1)[0])  # "25131.80"
+            
+            open_stack[symbol].append(len(trades))
+            trades.append({
+                'timestamp': timestamp,
+                'symbol': f"{symbol}_SB",  # Add _SB suffix for backtest comparison
+                'direction': direction.upper(),
+                'price': price
+            })
         
         elif '🚪 TRADE CLOSED' in line:
             # Example: [2025-12-19 08:50:02] 🚪 TRADE CLOSED - US30 (219) - LOSS @ 47977.10 | PnL: -18.0 pips
-            parts = line.split(']', 1)
-            if len(parts) < 2:
+            parsed = _split_log_line(line)
+            if parsed is None:
                 continue
-                
-            timestamp_str = parts[0].strip('[')
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
             
-            rest = parts[1].strip()
-            if '-' in rest and 'PnL:' in rest:
-                components = [c.strip() for c in rest.split('-')]
-                if len(components) >= 4:
-                    symbol_part = components[1]  # "US30 (219)"
-                    symbol = symbol_part.split('(')[0].strip()
-                    
-                    result = components[2].strip()  # "LOSS @ 47977.10 | PnL"
-                    
-                    # Get PnL
-                    pnl_part = rest.split('PnL:')[1].strip()
-                    pnl = float(pnl_part.split()[0])
-                    
-                    # Update the last trade for this symbol
-                    for trade in reversed(trades):
-                        if trade['symbol'] == f"{symbol}_SB" and 'exit_time' not in trade:
-                            trade['exit_time'] = timestamp
-                            trade['pnl'] = pnl
-                            trade['result'] = 'WIN' if pnl > 0 else 'LOSS'
-                            break
+            timestamp, symbol, _result, tail = parsed
+            pnl_idx = tail.find('PnL:')
+            if pnl_idx < 0:
+                continue
+            
+            # Get PnL
+            pnl = float(tail[pnl_idx + 4:].split(None, 1)[0])
+            
+            # Update the last open trade for this symbol
+            symbol_open = open_stack[symbol]
+            if symbol_open:
+                trade = trades[symbol_open.pop()]
+                trade['exit_time'] = timestamp
+                trade['pnl'] = pnl
+                trade['result'] = 'WIN' if pnl > 0 else 'LOSS'
     
     return trades
 
@@ -115,14 +127,15 @@ def match_trades(live_trades: List[Dict], backtest_trades: List[Dict]) -> Dict[s
     """
     matches = []
     unmatched_live = []
-    matched_backtest_ids = set()
+    # One flag byte per backtest trade instead of a hashed set of indices
+    matched_backtest = bytearray(len(backtest_trades))
     
     for live_trade in live_trades:
         best_match = None
         min_time_diff = timedelta(minutes=2)  # 2 minute tolerance
         
         for i, bt_trade in enumerate(backtest_trades):
-            if i in matched_backtest_ids:
+            if matched_backtest[i]:
                 continue
             
             # Check symbol and direction
@@ -139,7 +152,7 @@ def match_trades(live_trades: List[Dict], backtest_trades: List[Dict]) -> Dict[s
         
         if best_match:
             i, bt_trade, time_diff = best_match
-            matched_backtest_ids.add(i)
+            matched_backtest[i] = 1
             matches.append({
                 'live': live_trade,
                 'backtest': bt_trade,
@@ -148,7 +161,7 @@ def match_trades(live_trades: List[Dict], backtest_trades: List[Dict]) -> Dict[s
         else:
             unmatched_live.append(live_trade)
     
-    unmatched_backtest = [bt for i, bt in enumerate(backtest_trades) if i not in matched_backtest_ids]
+    unmatched_backtest = [bt for bt, matched in zip(backtest_trades, matched_backtest) if not matched]
     
     return {
         'matches': matches,
@@ -169,9 +182,8 @@ async def run_backtest_for_date(date_str: str, symbols: List[str]) -> List[Dict]
     Returns:
         List of trade dictionaries
     """
-    registry = StrategyRegistry()
-    data_connector = DataConnector()
-    engine = UniversalBacktestEngine(data_connector=data_connector)
+    registry = get_strategy_registry()
+    engine = UniversalBacktestEngine(data_connector=get_data_connector())
     
     arguments = {
         "strategy_name": "Stochastic Quad Rotation",
@@ -10,38 +10,49 @@ This script:
 """
 
 import json
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """Parse a JSON file, using orjson's C parser when it is installed."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def load_data():
     """Load tick and candle data from JSON files."""
-    with open('uk100_ticks_20260107.json', 'r') as f:
-        tick_response = json.load(f)
-        # Handle both array and dict responses
-        if isinstance(tick_response, dict):
-            tick_data = tick_response.get('data', tick_response)
-        else:
-            tick_data = tick_response
-    
-    with open('uk100_1m_candles_20260107.json', 'r') as f:
-        candle_response = json.load(f)
-        candle_data = candle_response['data'] if isinstance(candle_response, dict) else candle_response
+    tick_response = load_json('uk100_ticks_20260107.json')
+    # Handle both array and dict responses
+    if isinstance(tick_response, dict):
+        tick_data = tick_response.get('data', tick_response)
+    else:
+        tick_data = tick_response
+    
+    candle_response = load_json('uk100_1m_candles_20260107.json')
+    candle_data = candle_response['data'] if isinstance(candle_response, dict) else candle_response
     
     return tick_data, candle_data
 
 def ticks_to_1m_candles(tick_data):
     """Convert tick data to 1-minute OHLC candles."""
-    # Convert to DataFrame
-    records = []
-    for tick in tick_data:
-        records.append({
-            'timestamp': pd.to_datetime(tick['timestamp'], unit='ms'),
-            'price': (tick['bid'] + tick['ask']) / 2,  # Mid price
-            'volume': tick.get('volume', 1)
-        })
-    
-    df = pd.DataFrame(records)
-    df = df.set_index('timestamp')
+    # Build columnar arrays directly instead of an intermediate list of dicts
+    n = len(tick_data)
+    ts = np.fromiter((tick['timestamp'] for tick in tick_data), dtype=np.int64, count=n)
+    bid = np.fromiter((tick['bid'] for tick in tick_data), dtype=np.float64, count=n)
+    ask = np.fromiter((tick['ask'] for tick in tick_data), dtype=np.float64, count=n)
+    
+    df = pd.DataFrame(
+        {'price': (bid + ask) * 0.5},  # Mid price
+        index=pd.to_datetime(ts, unit='ms')
+    )
+    df.index.name = 'timestamp'
     
     # Resample to 1s candles first
     df_1s = df.resample('1S').agg({
@@ -62,18 +73,9 @@ def ticks_to_1m_candles(tick_data):
 
 def api_candles_to_df(candle_data):
     """Convert API candle data to DataFrame."""
-    records = []
-    for candle in candle_data:
-        records.append({
-            'timestamp': pd.to_datetime(candle['timestamp'], unit='ms'),
-            'open': candle['open'],
-            'high': candle['high'],
-            'low': candle['low'],
-            'close': candle['close'],
-            'volume': candle['volume']
-        })
-    
-    df = pd.DataFrame(records)
+    df = pd.DataFrame(candle_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    # Convert the whole timestamp column in one call
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
     df = df.set_index('timestamp')
     return df
 
@@ -99,35 +101,32 @@ def compare_candles(tick_candles, api_candles, start_minute=0, num_minutes=20):
     print(f"Time range: {window_times[0]} to {window_times[-1]}")
     print(f"{'='*80}\n")
     
-    # Compare candle by candle
-    differences = []
-    for ts in window_times:
-        tick_candle = tick_candles.loc[ts]
-        api_candle = api_candles.loc[ts]
-        
-        # Calculate differences
-        open_diff = abs(tick_candle['open'] - api_candle['open'])
-        high_diff = abs(tick_candle['high'] - api_candle['high'])
-        low_diff = abs(tick_candle['low'] - api_candle['low'])
-        close_diff = abs(tick_candle['close'] - api_candle['close'])
-        
-        max_diff = max(open_diff, high_diff, low_diff, close_diff)
-        
-        if max_diff > 0.5:  # Significant difference threshold
-            differences.append({
-                'time': ts,
-                'open_diff': open_diff,
-                'high_diff': high_diff,
-                'low_diff': low_diff,
-                'close_diff': close_diff,
-                'max_diff': max_diff
-            })
-        
-        # Print comparison
+    # Align both sources on the window once and diff the OHLC columns as arrays
+    ohlc_cols = ['open', 'high', 'low', 'close']
+    tick_ohlc = tick_candles.loc[window_times, ohlc_cols].to_numpy()
+    api_ohlc = api_candles.loc[window_times, ohlc_cols].to_numpy()
+    diffs = np.abs(tick_ohlc - api_ohlc)
+    max_diffs = diffs.max(axis=1)
+    
+    # Significant difference threshold
+    differences = [
+        {
+            'time': window_times[i],
+            'open_diff': diffs[i, 0],
+            'high_diff': diffs[i, 1],
+            'low_diff': diffs[i, 2],
+            'close_diff': diffs[i, 3],
+            'max_diff': max_diffs[i]
+        }
+        for i in np.flatnonzero(max_diffs > 0.5)
+    ]
+    
+    # Print comparison
+    for ts, tick_row, api_row, diff_row, max_diff in zip(window_times, tick_ohlc, api_ohlc, diffs, max_diffs):
         print(f"{ts.strftime('%H:%M:%S')}")
-        print(f"  Tick OHLC: {tick_candle['open']:.2f} {tick_candle['high']:.2f} {tick_candle['low']:.2f} {tick_candle['close']:.2f}")
-        print(f"  API  OHLC: {api_candle['open']:.2f} {api_candle['high']:.2f} {api_candle['low']:.2f} {api_candle['close']:.2f}")
-        print(f"  Diff:      {open_diff:.2f} {high_diff:.2f} {low_diff:.2f} {close_diff:.2f} (max: {max_diff:.2f})")
+        print(f"  Tick OHLC: {tick_row[0]:.2f} {tick_row[1]:.2f} {tick_row[2]:.2f} {tick_row[3]:.2f}")
+        print(f"  API  OHLC: {api_row[0]:.2f} {api_row[1]:.2f} {api_row[2]:.2f} {api_row[3]:.2f}")
+        print(f"  Diff:      {diff_row[0]:.2f} {diff_row[1]:.2f} {diff_row[2]:.2f} {diff_row[3]:.2f} (max: {max_diff:.2f})")
         print()
     
     # Summary
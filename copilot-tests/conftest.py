@@ -0,0 +1,41 @@
+"""
+pytest configuration for copilot-tests.
+
+The test scripts are written to run standalone (`python test_*.py`), but
+pytest can also run them in a single process, e.g.
+
+    pytest copilot-tests/test_stochastic_chart_fix.py copilot-tests/test_one_trade_at_a_time.py
+    pytest -n auto copilot-tests/    # with pytest-xdist
+
+so numpy/pandas/plotly and the shared modules are imported once per
+process instead of once per script.
+"""
+
+import asyncio
+import inspect
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path (the scripts use project-root imports and paths)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run the `async def test_*` scripts with asyncio.run, as their __main__ blocks do."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    funcargs = pyfuncitem.funcargs
+    kwargs = {name: funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**kwargs))
+    return True
+
+
+@pytest.fixture(scope="session")
+def data_connector():
+    """The shared DataConnector, created once for the whole session."""
+    from shared.data_connector import get_data_connector
+    return get_data_connector()
@@ -8,9 +8,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from datetime import datetime, timedelta
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
 from shared.strategies.dsl_interpreter.dsl_loader import load_dsl_strategy
-from shared.strategy_interface import StrategyContext
+from shared.strategy_interface import StrategyContext, CandleHistoryView
 from shared.models import Candle
 
 def debug_rotation_timing():
@@ -31,7 +31,7 @@ def debug_rotation_timing():
     print(f"Strategy loaded: {strategy.get_name()}")
     
     # Get data for December 30, 2025
-    connector = DataConnector()
+    connector = get_data_connector()
     start_date = datetime(2025, 12, 30, 0, 0)
     end_date = datetime(2025, 12, 30, 23, 59)
     
@@ -48,11 +48,18 @@ def debug_rotation_timing():
     # Process first 10 candles and track indicator values
     signal_count = 0
     
+    # Resolve once whether this strategy exposes indicator state. The dicts
+    # themselves are reassigned every candle, so read them fresh each time.
+    has_indicator_state = (
+        hasattr(strategy, 'indicator_values') and
+        hasattr(strategy, 'previous_indicator_values')
+    )
+    
     for i, candle in enumerate(candles[:20]):  # First 20 candles
         # Create context
         context = StrategyContext(
             current_candle=candle,
-            historical_candles=candles[:i+1],
+            historical_candles=CandleHistoryView(candles, i + 1),
             indicators={},
             current_position=None,
             symbol="GER40_SB",
@@ -65,22 +72,29 @@ def debug_rotation_timing():
         
         # Check indicator values BEFORE processing
         print(f"  BEFORE on_candle_processed:")
-        print(f"    indicator_values: {strategy.indicator_values if hasattr(strategy, 'indicator_values') else 'N/A'}")
-        print(f"    previous_indicator_values: {strategy.previous_indicator_values if hasattr(strategy, 'previous_indicator_values') else 'N/A'}")
+        if has_indicator_state:
+            print(f"    indicator_values: {strategy.indicator_values}")
+            print(f"    previous_indicator_values: {strategy.previous_indicator_values}")
+        else:
+            print(f"    indicator_values: N/A")
+            print(f"    previous_indicator_values: N/A")
         
         # Process candle (calculates indicators)
         strategy.on_candle_processed(context)
         
         # Check indicator values AFTER processing
         print(f"  AFTER on_candle_processed:")
-        if hasattr(strategy, 'indicator_values') and strategy.indicator_values:
-            print(f"    indicator_values:")
-            for key, val in strategy.indicator_values.items():
-                print(f"      {key}: {val:.2f}")
-        if hasattr(strategy, 'previous_indicator_values') and strategy.previous_indicator_values:
-            print(f"    previous_indicator_values:")
-            for key, val in strategy.previous_indicator_values.items():
-                print(f"      {key}: {val:.2f}")
+        if has_indicator_state:
+            indicator_values = strategy.indicator_values
+            previous_indicator_values = strategy.previous_indicator_values
+            if indicator_values:
+                print(f"    indicator_values:")
+                for key, val in indicator_values.items():
+                    print(f"      {key}: {val:.2f}")
+            if previous_indicator_values:
+                print(f"    previous_indicator_values:")
+                for key, val in previous_indicator_values.items():
+                    print(f"      {key}: {val:.2f}")
         
         # Try to generate signal
         signal = strategy.generate_signal(context)
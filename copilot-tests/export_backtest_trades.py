@@ -9,19 +9,75 @@ Usage:
         --symbols US500_SB,NAS100_SB,GER40_SB,UK100_SB,US30_SB
 """
 import asyncio
+import os
 import sys
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from shared.strategy_registry import StrategyRegistry
+from shared.strategy_registry import get_strategy_registry
 from mcp_servers.universal_backtest_engine import UniversalBacktestEngine, BacktestConfiguration
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+
+
+def _isoformat(value):
+    """JSON fallback serializer for datetime-like values."""
+    return value.isoformat()
+
+
+def backtest_symbol_trades(symbol: str, date_str: str, sl_pips: int, tp_pips: int) -> list:
+    """
+    Run one symbol's backtest and return its trades as plain dicts.
+    
+    Runs in a worker process and only returns picklable data. The registry
+    and connector are per-process globals, so a worker that handles several
+    symbols loads strategies once and shares one market data cache.
+    """
+    print(f"Running backtest for {symbol}...")
+    
+    registry = get_strategy_registry()
+    engine = UniversalBacktestEngine(data_connector=get_data_connector())
+    
+    config = BacktestConfiguration(
+        symbol=symbol,
+        timeframe="1m",
+        start_date=date_str,
+        end_date=date_str,
+        initial_balance=10000,
+        risk_per_trade=0.02,
+        stop_loss_pips=sl_pips,
+        take_profit_pips=tp_pips
+    )
+    
+    strategy = registry.create_strategy("Stochastic Quad Rotation")
+    backtest_results = asyncio.run(engine.run_backtest(strategy, config))
+    
+    # Extract trades
+    return [
+        {
+            'symbol': symbol,
+            'direction': trade.direction.name,
+            'entry_time': trade.entry_time,
+            'entry_price': trade.entry_price,
+            'exit_time': trade.exit_time,
+            'exit_price': trade.exit_price,
+            'pips': trade.pips,
+            'result': trade.result.name,
+            'stop_loss': trade.stop_loss,
+            'take_profit': trade.take_profit
+        }
+        for trade in backtest_results.trades
+    ]
 
 
 async def export_trades_for_date(date_str: str, symbols: list, sl_pips: int = 15, tp_pips: int = 15):
@@ -43,45 +99,20 @@ async def export_trades_for_date(date_str: str, symbols: list, sl_pips: int = 15
     print("=" * 80)
     print()
     
-    registry = StrategyRegistry()
-    data_connector = DataConnector()
-    engine = UniversalBacktestEngine(data_connector=data_connector)
+    # Backtests are CPU-bound (indicator math, DSL evaluation), so run each
+    # symbol in its own worker process rather than on this event loop
+    loop = asyncio.get_running_loop()
+    max_workers = min(len(symbols), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        trades_per_symbol = await asyncio.gather(*(
+            loop.run_in_executor(pool, backtest_symbol_trades, symbol, date_str, sl_pips, tp_pips)
+            for symbol in symbols
+        ))
     
     all_trades = []
-    
-    for symbol in symbols:
-        print(f"Running backtest for {symbol}...")
-        
-        config = BacktestConfiguration(
-            symbol=symbol,
-            timeframe="1m",
-            start_date=date_str,
-            end_date=date_str,
-            initial_balance=10000,
-            risk_per_trade=0.02,
-            stop_loss_pips=sl_pips,
-            take_profit_pips=tp_pips
-        )
-        
-        strategy = registry.create_strategy("Stochastic Quad Rotation")
-        backtest_results = await engine.run_backtest(strategy, config)
-        
-        # Extract trades
-        for trade in backtest_results.trades:
-            all_trades.append({
-                'symbol': symbol,
-                'direction': trade.direction.name,
-                'entry_time': trade.entry_time.isoformat(),
-                'entry_price': trade.entry_price,
-                'exit_time': trade.exit_time.isoformat() if trade.exit_time else None,
-                'exit_price': trade.exit_price,
-                'pips': trade.pips,
-                'result': trade.result.name,
-                'stop_loss': trade.stop_loss,
-                'take_profit': trade.take_profit
-            })
-        
-        print(f"  ✅ {len(backtest_results.trades)} trades found")
+    for symbol, symbol_trades in zip(symbols, trades_per_symbol):
+        all_trades.extend(symbol_trades)
+        print(f"  ✅ {symbol}: {len(symbol_trades)} trades found")
     
     print()
     print("=" * 80)
@@ -93,8 +124,12 @@ async def export_trades_for_date(date_str: str, symbols: list, sl_pips: int = 15
     output_file = project_root / "data" / f"backtest_trades_{date_str.replace('-', '')}.json"
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        json.dump(all_trades, f, indent=2)
+    # Datetimes are serialized to ISO-8601 strings on write
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(all_trades, default=_isoformat, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(all_trades, f, indent=2, default=_isoformat)
     
     print(f"💾 Trades exported to: {output_file}")
     print()
@@ -102,8 +137,8 @@ async def export_trades_for_date(date_str: str, symbols: list, sl_pips: int = 15
     # Display summary
     print("📊 TRADE SUMMARY:")
     for trade in all_trades:
-        entry_time = datetime.fromisoformat(trade['entry_time'])
-        exit_time = datetime.fromisoformat(trade['exit_time']) if trade['exit_time'] else None
+        entry_time = trade['entry_time']
+        exit_time = trade['exit_time']
         
         exit_str = f" → {exit_time.strftime('%H:%M:%S')}" if exit_time else ""
         result_str = f" ({trade['result']}: {trade['pips']:+.1f} pips)" if trade['result'] != 'PENDING' else ""
@@ -7,89 +7,133 @@ CORRECT LOGIC:
 - SELL: Previous candle all 4 > 80, current candle fast crosses below 80
 """
 
+import functools
+
+import numpy as np
 import pandas as pd
 
-# Load the analysis data
-df = pd.read_csv('copilot-tests/stochastic_analysis_ger40_20251230.csv')
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+STOCH_COLUMNS = ['fast_k', 'med_fast_k', 'med_slow_k', 'slow_k']
+
+# Load the analysis data - only the columns we use. Stochastics stay float64:
+# float32 can round values at the edge (e.g. 79.99999) across the 20/80
+# thresholds and change which signals fire.
+CSV_PATH = 'copilot-tests/stochastic_analysis_ger40_20251230.csv'
+CSV_OPTIONS = dict(
+    usecols=['timestamp', 'close'] + STOCH_COLUMNS,
+    dtype={col: 'float64' for col in STOCH_COLUMNS},
+)
+try:
+    df = pd.read_csv(CSV_PATH, engine='pyarrow', **CSV_OPTIONS)
+except ImportError:
+    # pyarrow not installed - fall back to the default C parser
+    df = pd.read_csv(CSV_PATH, **CSV_OPTIONS)
 
 print("=" * 100)
 print("CORRECT SIGNAL DETECTION - Matching Rust Signal Monitor Logic")
 print("=" * 100)
 
-buy_signals = []
-sell_signals = []
+# Pull the columns out once as contiguous arrays; row i pairs prev=i-1 with curr=i
+stochs = df[STOCH_COLUMNS].to_numpy(dtype=np.float64)
 
-# Iterate through candles (starting from index 1 to have previous candle)
-for i in range(1, len(df)):
-    prev = df.iloc[i-1]
-    curr = df.iloc[i]
-    
-    # Check BUY signal
-    # Previous: all 4 < 20
-    prev_all_below_20 = (
-        prev['fast_k'] < 20 and
-        prev['med_fast_k'] < 20 and
-        prev['med_slow_k'] < 20 and
-        prev['slow_k'] < 20
-    )
-    
-    # Current: fast crosses above 20
-    fast_crosses_above = prev['fast_k'] < 20 and curr['fast_k'] >= 20
+
+OVERSOLD = 20.0
+OVERBOUGHT = 80.0
+
+
+@functools.lru_cache(maxsize=16)
+def make_rotation_detector(low, high):
+    """
+    Build a rotation signal detector specialized for fixed zone thresholds.
     
-    if prev_all_below_20 and fast_crosses_above:
-        buy_signals.append({
-            'time': curr['timestamp'],
-            'prev_fast': prev['fast_k'],
-            'curr_fast': curr['fast_k'],
-            'prev_all': [prev['fast_k'], prev['med_fast_k'], prev['med_slow_k'], prev['slow_k']],
-            'curr_all': [curr['fast_k'], curr['med_fast_k'], curr['med_slow_k'], curr['slow_k']],
-            'price': curr['close']
-        })
+    low/high are closure constants, so Numba folds them into the compiled
+    comparisons. One detector is compiled per (low, high) pair and reused.
+    Without Numba the equivalent vectorized NumPy masks are returned.
+    """
+    if njit is None:
+        def detect_numpy(fk, mfk, msk, sk):
+            prev = np.column_stack((fk[:-1], mfk[:-1], msk[:-1], sk[:-1]))
+            curr_fast = fk[1:]
+            # prev fast beyond the threshold is already implied by the all-4 zone check
+            buy_mask = (prev < low).all(axis=1) & (curr_fast >= low)
+            sell_mask = (prev > high).all(axis=1) & (curr_fast <= high)
+            return np.flatnonzero(buy_mask) + 1, np.flatnonzero(sell_mask) + 1
+        
+        return detect_numpy
     
-    # Check SELL signal
-    # Previous: all 4 > 80
-    prev_all_above_80 = (
-        prev['fast_k'] > 80 and
-        prev['med_fast_k'] > 80 and
-        prev['med_slow_k'] > 80 and
-        prev['slow_k'] > 80
-    )
+    @njit
+    def detect_kernel(fk, mfk, msk, sk):
+        # Single pass over the series; returns current-candle row indices
+        n = fk.shape[0]
+        buy_idx = np.empty(n, dtype=np.int64)
+        sell_idx = np.empty(n, dtype=np.int64)
+        n_buy = 0
+        n_sell = 0
+        for i in range(1, n):
+            p_fk = fk[i - 1]
+            p_mfk = mfk[i - 1]
+            p_msk = msk[i - 1]
+            p_sk = sk[i - 1]
+            # BUY: previous all 4 < low, current fast crosses above low
+            if p_fk < low and p_mfk < low and p_msk < low and p_sk < low and fk[i] >= low:
+                buy_idx[n_buy] = i
+                n_buy += 1
+            # SELL: previous all 4 > high, current fast crosses below high
+            elif p_fk > high and p_mfk > high and p_msk > high and p_sk > high and fk[i] <= high:
+                sell_idx[n_sell] = i
+                n_sell += 1
+        return buy_idx[:n_buy], sell_idx[:n_sell]
     
-    # Current: fast crosses below 80
-    fast_crosses_below = prev['fast_k'] > 80 and curr['fast_k'] <= 80
+    return detect_kernel
+
+
+detect_rotation_signals = make_rotation_detector(OVERSOLD, OVERBOUGHT)
+buy_idx, sell_idx = detect_rotation_signals(
+    np.ascontiguousarray(stochs[:, 0]),
+    np.ascontiguousarray(stochs[:, 1]),
+    np.ascontiguousarray(stochs[:, 2]),
+    np.ascontiguousarray(stochs[:, 3]),
+)
+
+def build_signals(idx):
+    """Gather signal columns (SoA) for the given current-candle row indices."""
+    return {
+        'time': df['timestamp'].to_numpy()[idx],
+        'price': df['close'].to_numpy()[idx],
+        'prev_all': stochs[idx - 1],  # (N, 4)
+        'curr_all': stochs[idx],      # (N, 4)
+    }
+
+
+def print_signals(label, signals):
+    """Print signal details, formatting only at output time."""
+    count = len(signals['time'])
+    print(f"\n✅ {label} SIGNALS FOUND: {count}")
+    if not count:
+        return
     
-    if prev_all_above_80 and fast_crosses_below:
-        sell_signals.append({
-            'time': curr['timestamp'],
-            'prev_fast': prev['fast_k'],
-            'curr_fast': curr['fast_k'],
-            'prev_all': [prev['fast_k'], prev['med_fast_k'], prev['med_slow_k'], prev['slow_k']],
-            'curr_all': [curr['fast_k'], curr['med_fast_k'], curr['med_slow_k'], curr['slow_k']],
-            'price': curr['close']
-        })
-
-print(f"\n✅ BUY SIGNALS FOUND: {len(buy_signals)}")
-if buy_signals:
-    print("\nBUY SIGNAL DETAILS:")
+    print(f"\n{label} SIGNAL DETAILS:")
     print("-" * 100)
-    for sig in buy_signals:
-        print(f"\nTime: {sig['time']}")
-        print(f"Price: {sig['price']:.2f}")
-        print(f"Previous candle stochastics: {[f'{x:.2f}' for x in sig['prev_all']]}")
-        print(f"Current candle stochastics:  {[f'{x:.2f}' for x in sig['curr_all']]}")
-        print(f"Fast crossed: {sig['prev_fast']:.2f} → {sig['curr_fast']:.2f}")
-
-print(f"\n✅ SELL SIGNALS FOUND: {len(sell_signals)}")
-if sell_signals:
-    print("\nSELL SIGNAL DETAILS:")
-    print("-" * 100)
-    for sig in sell_signals:
-        print(f"\nTime: {sig['time']}")
-        print(f"Price: {sig['price']:.2f}")
-        print(f"Previous candle stochastics: {[f'{x:.2f}' for x in sig['prev_all']]}")
-        print(f"Current candle stochastics:  {[f'{x:.2f}' for x in sig['curr_all']]}")
-        print(f"Fast crossed: {sig['prev_fast']:.2f} → {sig['curr_fast']:.2f}")
+    for time, price, prev_all, curr_all in zip(
+        signals['time'], signals['price'], signals['prev_all'], signals['curr_all']
+    ):
+        print(f"\nTime: {time}")
+        print(f"Price: {price:.2f}")
+        print(f"Previous candle stochastics: {[f'{x:.2f}' for x in prev_all]}")
+        print(f"Current candle stochastics:  {[f'{x:.2f}' for x in curr_all]}")
+        print(f"Fast crossed: {prev_all[0]:.2f} → {curr_all[0]:.2f}")
+
+
+buy_signals = build_signals(buy_idx)
+sell_signals = build_signals(sell_idx)
+
+print_signals("BUY", buy_signals)
+print_signals("SELL", sell_signals)
 
 print("\n" + "=" * 100)
-print(f"TOTAL SIGNALS: {len(buy_signals) + len(sell_signals)}")
+print(f"TOTAL SIGNALS: {len(buy_idx) + len(sell_idx)}")
 print("=" * 100)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Batch Test Runner
+
+Runs the stochastic / DSL test scripts in parallel worker processes instead
+of one `python test_*.py` at a time. Each script is executed as __main__ in
+a forked worker, so the heavy imports (pandas, numpy, plotly) are paid once
+in this process and shared by every worker.
+
+A script fails if it exits non-zero, raises, or runs past the timeout.
+
+Usage:
+    python copilot-tests/run_all.py
+    python copilot-tests/run_all.py --timeout 300 -v test_simple_chart.py
+"""
+
+import argparse
+import io
+import multiprocessing as mp
+import os
+import runpy
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+TESTS_DIR = Path(__file__).parent
+PROJECT_ROOT = TESTS_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Import the shared heavy dependencies up front so forked workers inherit them
+import numpy  # noqa: E402,F401
+import pandas  # noqa: E402,F401
+import shared.models  # noqa: E402,F401
+import shared.strategy_interface  # noqa: E402,F401
+
+DEFAULT_TESTS = [
+    "test_on_candle_processed.py",
+    "test_on_candle_simple.py",
+    "test_one_trade_at_a_time.py",
+    "test_simple_chart.py",
+    "test_stochastic_backtest.py",
+    "test_stochastic_calculation.py",
+    "test_stochastic_chart_fix.py",
+    "test_stochastic_charting.py",
+]
+DEFAULT_TIMEOUT = 120
+
+
+class TestTimeout(BaseException):
+    """
+    Raised in a worker when its test runs past the timeout.
+    
+    A BaseException, so the scripts' (and DataConnector's) `except Exception`
+    handlers can't swallow it and let a timed-out test "pass".
+    """
+
+
+def _on_timeout(signum, frame):
+    raise TestTimeout()
+
+
+def _run_script(script: str, timeout: int):
+    """
+    Run one test script as __main__ in a worker.
+
+    Returns (script, exit_code, seconds, captured_output). The timeout is
+    enforced inside the worker with SIGALRM, so a hung script is interrupted
+    rather than left holding a pool slot.
+    """
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    exit_code = 0
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.alarm(timeout)
+    try:
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            runpy.run_path(str(TESTS_DIR / script), run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            exit_code = 0 if e.code is None else 1
+    except TestTimeout:
+        buffer.write(f"\n❌ Timed out after {timeout}s\n")
+        exit_code = 1
+    except BaseException:
+        buffer.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        signal.alarm(0)
+    return script, exit_code, time.perf_counter() - start, buffer.getvalue()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run test scripts in parallel worker processes")
+    parser.add_argument("tests", nargs="*", default=DEFAULT_TESTS,
+                        help="Test scripts in copilot-tests/ (default: the stochastic/DSL suite)")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                        help=f"Per-test timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Print the output of passing tests too")
+    args = parser.parse_args()
+
+    # The scripts use paths relative to the project root
+    os.chdir(PROJECT_ROOT)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs, mp_context=mp.get_context("fork")) as executor:
+        futures = [executor.submit(_run_script, test, args.timeout) for test in args.tests]
+        completed = as_completed(futures)
+        if tqdm is not None:
+            completed = tqdm(completed, total=len(futures), desc="Tests")
+        for future in completed:
+            results.append(future.result())
+
+    results.sort(key=lambda result: args.tests.index(result[0]))
+    failed = [result for result in results if result[1] != 0]
+
+    for script, exit_code, seconds, output in results:
+        if args.verbose or exit_code != 0:
+            print("\n" + "=" * 80)
+            print(script)
+            print("=" * 80)
+            print(output, end="")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    for script, exit_code, seconds, _ in results:
+        status = "✅ PASS" if exit_code == 0 else "❌ FAIL"
+        print(f"{status}  {script:<40} {seconds:6.1f}s")
+    print(f"\n{len(results) - len(failed)}/{len(results)} passed")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
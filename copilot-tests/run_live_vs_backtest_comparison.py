@@ -3,11 +3,31 @@
 Compare live trading signals with backtest results for December 19, 2025
 """
 
+import functools
+import io
 import json
-from datetime import datetime, timedelta
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import List, Dict, Optional
 from collections import defaultdict
 
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Your live trading logs from December 19, 2025
 LIVE_TRADES_LOG = """
 ✅ TRADE ENTERED - NAS100 (205) - Sell @ 25131.80 (SL: 25146.80 | TP: 25116.80)
@@ -69,108 +89,181 @@ LIVE_TRADES_LOG = """
 """
 
 
+# Live log symbol -> backtest symbol
+SYMBOL_MAP = {
+    'NAS100': 'NAS100_SB',
+    'US500': 'US500_SB',
+    'US30': 'US30_SB',
+    'GER40': 'GER40_SB',
+    'UK100': 'UK100_SB'
+}
+
+# Price units per pip, matching UniversalBacktestEngine._get_pip_value (indices: 1 point = 1 pip)
+SYMBOL_PIP = {symbol: 1.0 for symbol in SYMBOL_MAP.values()}
+DEFAULT_PIP = 1.0
+
+_DIRECTION_CODES = {'BUY': 1, 'SELL': -1}
+
+
+# e.g. "✅ TRADE ENTERED - NAS100 (205) - Sell @ 25131.80 (SL: 25146.80 | TP: 25116.80)"
+_ENTRY_RE = re.compile(
+    r'TRADE ENTERED - (\w+) \(\d+\) - (Buy|Sell) @ ([\d.]+) \(SL: ([\d.]+) \| TP: ([\d.]+)\)'
+)
+
+
 def parse_live_trades(log_text: str) -> List[Dict]:
     """Parse live trading logs into structured trade data"""
     trades = []
-    lines = log_text.strip().split('\n')
+    lines = iter(log_text.splitlines())
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        if line.startswith('✅ TRADE ENTERED'):
-            # Extract trade details
-            parts = line.split(' - ')
-            if len(parts) >= 3:
-                # Extract symbol and ID
-                symbol_part = parts[1].split('(')[0].strip()
-                
-                # Normalize symbol names
-                symbol_map = {
-                    'NAS100': 'NAS100_SB',
-                    'US500': 'US500_SB',
-                    'US30': 'US30_SB',
-                    'GER40': 'GER40_SB',
-                    'UK100': 'UK100_SB'
-                }
-                symbol = symbol_map.get(symbol_part, symbol_part)
-                
-                # Extract direction and price
-                trade_details = parts[2]
-                direction = 'BUY' if 'Buy' in trade_details else 'SELL'
-                entry_price = float(trade_details.split('@')[1].split('(')[0].strip())
-                
-                # Extract SL and TP
-                sl_tp = trade_details.split('(SL:')[1].rstrip(')')
-                sl = float(sl_tp.split('|')[0].strip())
-                tp = float(sl_tp.split('TP:')[1].strip())
-                
-                # Get timestamp from next line
-                timestamp_str = lines[i + 1].strip()
-                entry_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                
-                trades.append({
-                    'symbol': symbol,
-                    'direction': direction,
-                    'entry_time': entry_time.strftime('%Y-%m-%dT%H:%M:%S'),
-                    'entry_price': entry_price,
-                    'stop_loss': sl,
-                    'take_profit': tp
-                })
+    for line in lines:
+        # Cheap substring test before running the regex
+        if 'TRADE ENTERED' not in line:
+            continue
         
-        i += 1
+        # Extract trade details in one pass
+        m = _ENTRY_RE.search(line)
+        if m:
+            symbol_part, side, entry_price, sl, tp = m.groups()
+            symbol = SYMBOL_MAP.get(symbol_part, symbol_part)
+            
+            # Timestamp is on the line following the entry
+            timestamp_str = next(lines).strip()
+            entry_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            
+            trades.append({
+                'symbol': symbol,
+                'direction': side.upper(),
+                'entry_time': entry_time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'entry_time_str': entry_time.strftime('%H:%M:%S'),
+                'entry_price': float(entry_price),
+                'stop_loss': float(sl),
+                'take_profit': float(tp)
+            })
     
     return trades
 
 
+_UTC = timezone.utc
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
+
+
+@functools.lru_cache(maxsize=4096)
+def _ts_ns(timestamp_str: str) -> int:
+    """Parse an ISO timestamp to integer epoch nanoseconds (naive timestamps are taken as UTC)."""
+    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+@dataclass
+class TradeTable:
+    """Columnar (one array per field) view of a list of trade dicts."""
+    symbol_id: np.ndarray    # int32 index into the caller's symbol vocabulary
+    direction: np.ndarray    # int8, +1 BUY / -1 SELL
+    entry_ns: np.ndarray     # int64 epoch nanoseconds
+    entry_price: np.ndarray  # float64
+
+    @classmethod
+    def from_dicts(cls, trades: List[Dict], symbol_ids: Dict[str, int]) -> 'TradeTable':
+        n = len(trades)
+        return cls(
+            symbol_id=np.fromiter((symbol_ids[t['symbol']] for t in trades), dtype=np.int32, count=n),
+            direction=np.fromiter((_DIRECTION_CODES.get(t['direction'], 0) for t in trades), dtype=np.int8, count=n),
+            entry_ns=np.fromiter((_ts_ns(t['entry_time']) for t in trades), dtype=np.int64, count=n),
+            entry_price=np.fromiter((t['entry_price'] for t in trades), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.entry_ns)
+
+    def bucket_keys(self) -> np.ndarray:
+        """One int64 key per (symbol, direction) pair."""
+        return self.symbol_id.astype(np.int64) * 4 + self.direction + 1
+
+
 def match_trades(live_trades: List[Dict], backtest_trades: List[Dict], 
-                 time_tolerance_minutes: int = 2) -> Dict:
+                 time_tolerance_minutes: int = 2,
+                 price_tolerance_pips: float = 2.0) -> Dict:
     """
     Match live trades with backtest trades based on:
     - Symbol
     - Direction
-    - Entry time (within tolerance)
-    - Entry price (approximately)
+    - Entry time (within time_tolerance_minutes)
+    - Entry price (within price_tolerance_pips, using the symbol's pip size)
+    
+    Both sides are converted to TradeTable columns. Backtest rows are sorted
+    by (symbol, direction, entry time), so each live trade finds its bucket
+    and time window with searchsorted and scores the candidates in one
+    vectorized pass.
     """
     matches = []
     unmatched_live = []
-    unmatched_backtest = list(backtest_trades)
+    tolerance_ns = time_tolerance_minutes * _NS_PER_MINUTE
+    
+    # Symbol vocabulary shared by both tables, so their bucket keys line up
+    symbols = sorted({t['symbol'] for t in live_trades} | {t['symbol'] for t in backtest_trades})
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+    live = TradeTable.from_dicts(live_trades, symbol_ids)
+    backtest = TradeTable.from_dicts(backtest_trades, symbol_ids)
+    
+    # Stable sort keeps equal (key, time) rows in original list order
+    bt_keys = backtest.bucket_keys()
+    order = np.lexsort((backtest.entry_ns, bt_keys))
+    keys = bt_keys[order]
+    times = backtest.entry_ns[order]
+    prices = backtest.entry_price[order]
+    
+    used = np.zeros(len(backtest), dtype=bool)
     
-    for live_trade in live_trades:
-        live_time = datetime.fromisoformat(live_trade['entry_time'])
-        best_match = None
-        best_match_score = 0
+    for i, (key, live_time, live_price) in enumerate(zip(
+            live.bucket_keys().tolist(), live.entry_ns.tolist(), live.entry_price.tolist())):
+        live_trade = live_trades[i]
+        best_idx = None
+        best_time = 0
         
-        for bt_trade in unmatched_backtest:
-            bt_time = datetime.fromisoformat(bt_trade['entry_time'])
+        start = int(np.searchsorted(keys, key, side='left'))
+        stop = int(np.searchsorted(keys, key, side='right'))
+        lo = start + int(np.searchsorted(times[start:stop], live_time - tolerance_ns, side='left'))
+        hi = start + int(np.searchsorted(times[start:stop], live_time + tolerance_ns, side='right'))
+        
+        if lo < hi:
+            window_times = times[lo:hi]
+            window_idxs = order[lo:hi]
+            pip = SYMBOL_PIP.get(symbols[key // 4], DEFAULT_PIP)
+            pip_diffs = np.abs(prices[lo:hi] - live_price) / pip
             
-            # Check basic criteria
-            if (bt_trade['symbol'] == live_trade['symbol'] and 
-                bt_trade['direction'] == live_trade['direction']):
-                
-                # Check time proximity
-                time_diff = abs((live_time - bt_time).total_seconds() / 60)
-                if time_diff <= time_tolerance_minutes:
-                    # Check price proximity (within 2 pips)
-                    price_diff = abs(bt_trade['entry_price'] - live_trade['entry_price'])
-                    if price_diff <= 2.0:
-                        match_score = 100 - time_diff - price_diff
-                        if match_score > best_match_score:
-                            best_match = bt_trade
-                            best_match_score = match_score
+            # Unused candidates within the pip tolerance of the live entry
+            valid = ~used[window_idxs] & (pip_diffs <= price_tolerance_pips)
+            if valid.any():
+                scores = 100 - np.abs(window_times - live_time) / _NS_PER_MINUTE - pip_diffs
+                scores[~valid] = -np.inf
+                best_match_score = scores.max()
+                if best_match_score > 0:
+                    # Ties go to the earlier backtest trade, as in list order
+                    tied = np.flatnonzero(scores == best_match_score)
+                    j = tied[np.argmin(window_idxs[tied])]
+                    best_idx = int(window_idxs[j])
+                    best_time = int(window_times[j])
         
-        if best_match:
+        if best_idx is not None:
+            best_match = backtest_trades[best_idx]
+            used[best_idx] = True
             matches.append({
                 'live': live_trade,
                 'backtest': best_match,
-                'time_diff_seconds': (datetime.fromisoformat(live_trade['entry_time']) - 
-                                     datetime.fromisoformat(best_match['entry_time'])).total_seconds(),
+                'time_diff_seconds': (live_time - best_time) / _NS_PER_SECOND,
                 'price_diff': abs(live_trade['entry_price'] - best_match['entry_price'])
             })
-            unmatched_backtest.remove(best_match)
         else:
             unmatched_live.append(live_trade)
     
+    # Matched trades were only flagged, never removed - collect the rest once
+    unmatched_backtest = [backtest_trades[idx] for idx in np.flatnonzero(~used)]
+    
     return {
         'matches': matches,
         'unmatched_live': unmatched_live,
@@ -188,64 +281,87 @@ def print_comparison_report(comparison: Dict):
     total_backtest = len(matches) + len(unmatched_backtest)
     match_rate = (len(matches) / total_live * 100) if total_live > 0 else 0
     
-    print("\n" + "=" * 80)
-    print("📊 LIVE TRADING vs BACKTEST COMPARISON - December 19, 2025")
-    print("=" * 80)
+    # Group matched and unmatched backtest trades by symbol up front
+    matches_by_symbol = defaultdict(list)
+    unmatched_by_symbol = defaultdict(list)
+    for match in matches:
+        matches_by_symbol[match['live']['symbol']].append(match)
+    for trade in unmatched_backtest:
+        unmatched_by_symbol[trade['symbol']].append(trade)
     
-    print(f"\n📈 SUMMARY:")
-    print(f"   Live Trades: {total_live}")
-    print(f"   Backtest Trades: {total_backtest}")
-    print(f"   Matched Trades: {len(matches)}")
-    print(f"   Match Rate: {match_rate:.1f}%")
+    # Build the whole report in memory and write it once
+    buf = io.StringIO()
+    out = buf.write
     
-    print(f"\n✅ MATCHED TRADES ({len(matches)}):")
-    print("-" * 80)
+    out("\n" + "=" * 80 + "\n")
+    out("📊 LIVE TRADING vs BACKTEST COMPARISON - December 19, 2025\n")
+    out("=" * 80 + "\n")
     
-    # Group by symbol
-    by_symbol = defaultdict(list)
-    for match in matches:
-        by_symbol[match['live']['symbol']].append(match)
+    out(f"\n📈 SUMMARY:\n")
+    out(f"   Live Trades: {total_live}\n")
+    out(f"   Backtest Trades: {total_backtest}\n")
+    out(f"   Matched Trades: {len(matches)}\n")
+    out(f"   Match Rate: {match_rate:.1f}%\n")
+    
+    out(f"\n✅ MATCHED TRADES ({len(matches)}):\n")
+    out("-" * 80 + "\n")
     
-    for symbol in sorted(by_symbol.keys()):
-        print(f"\n  {symbol}:")
-        for match in by_symbol[symbol]:
+    for symbol in sorted(matches_by_symbol):
+        out(f"\n  {symbol}:\n")
+        for match in matches_by_symbol[symbol]:
             live = match['live']
             bt = match['backtest']
-            time_diff = match['time_diff_seconds']
-            price_diff = match['price_diff']
-            
-            print(f"    {live['entry_time'][11:19]} | {live['direction']:4s} | "
-                  f"Live: {live['entry_price']:>10.2f} | BT: {bt['entry_price']:>10.2f} | "
-                  f"Δtime: {time_diff:>5.0f}s | Δprice: {price_diff:>6.2f}")
+            out(f"    {live['entry_time_str']} | {live['direction']:4s} | "
+                f"Live: {live['entry_price']:>10.2f} | BT: {bt['entry_price']:>10.2f} | "
+                f"Δtime: {match['time_diff_seconds']:>5.0f}s | Δprice: {match['price_diff']:>6.2f}\n")
     
     if unmatched_live:
-        print(f"\n⚠️  UNMATCHED LIVE TRADES ({len(unmatched_live)}):")
-        print("-" * 80)
+        out(f"\n⚠️  UNMATCHED LIVE TRADES ({len(unmatched_live)}):\n")
+        out("-" * 80 + "\n")
         for trade in unmatched_live:
-            print(f"    {trade['entry_time'][11:19]} | {trade['symbol']:12s} | "
-                  f"{trade['direction']:4s} @ {trade['entry_price']:>10.2f}")
+            out(f"    {trade['entry_time_str']} | {trade['symbol']:12s} | "
+                f"{trade['direction']:4s} @ {trade['entry_price']:>10.2f}\n")
     
     if unmatched_backtest:
-        print(f"\n🔍 BACKTEST TRADES NOT IN LIVE ({len(unmatched_backtest)}):")
-        print("-" * 80)
-        by_symbol = defaultdict(list)
-        for trade in unmatched_backtest:
-            by_symbol[trade['symbol']].append(trade)
-        
-        for symbol in sorted(by_symbol.keys()):
-            print(f"\n  {symbol}:")
-            for trade in by_symbol[symbol]:
-                print(f"    {trade['entry_time'][11:19]} | {trade['direction']:4s} @ "
-                      f"{trade['entry_price']:>10.2f} | Result: {trade['result']:4s} ({trade['pips']:>+6.1f} pips)")
+        out(f"\n🔍 BACKTEST TRADES NOT IN LIVE ({len(unmatched_backtest)}):\n")
+        out("-" * 80 + "\n")
+        for symbol in sorted(unmatched_by_symbol):
+            out(f"\n  {symbol}:\n")
+            for trade in unmatched_by_symbol[symbol]:
+                out(f"    {trade['entry_time_str']} | {trade['direction']:4s} @ "
+                    f"{trade['entry_price']:>10.2f} | Result: {trade['result']:4s} ({trade['pips']:>+6.1f} pips)\n")
     
-    print("\n" + "=" * 80)
+    out("\n" + "=" * 80 + "\n")
+    sys.stdout.write(buf.getvalue())
+
+
+# Fields the matcher and report read from each backtest trade
+BACKTEST_FIELDS = ('symbol', 'direction', 'entry_time', 'entry_price', 'result', 'pips')
+
+
+def load_backtest_trades(path) -> List[Dict]:
+    """Load backtest trades, keeping only the fields used for comparison.
+
+    Streams records with ijson when available so the full decoded file is
+    never held in memory; otherwise falls back to json.load.
+    """
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            records = ijson.items(f, 'item', use_float=True)
+        else:
+            records = json.load(f)
+        trades = [{field: record[field] for field in BACKTEST_FIELDS} for record in records]
+    # Pre-format the report's HH:MM:SS column once at load time
+    for trade in trades:
+        trade['entry_time_str'] = trade['entry_time'][11:19]
+    return trades
 
 
 def main():
     # Load backtest trades
-    backtest_file = '/Users/paul/Sites/PythonProjects/Trading-MCP/data/backtest_trades_20251219.json'
-    with open(backtest_file, 'r') as f:
-        backtest_trades = json.load(f)
+    data_dir = project_root / "data"
+    backtest_file = data_dir / "backtest_trades_20251219.json"
+    backtest_trades = load_backtest_trades(backtest_file)
     
     print(f"📁 Loaded {len(backtest_trades)} backtest trades from {backtest_file}")
     
@@ -260,11 +376,16 @@ def main():
     print_comparison_report(comparison)
     
     # Save detailed comparison to JSON
-    output_file = '/Users/paul/Sites/PythonProjects/Trading-MCP/data/live_vs_backtest_comparison_20251219.json'
-    with open(output_file, 'w') as f:
-        json.dump(comparison, f, indent=2)
+    output_file = data_dir / "live_vs_backtest_comparison_20251219.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(comparison, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(comparison, f, indent=2)
     
     print(f"\n💾 Detailed comparison saved to: {output_file}")
+    return output_file
 
 
 if __name__ == '__main__':
@@ -6,7 +6,9 @@ Uses the optimal 15/15 SL/TP configuration.
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 
 # Add parent directory to path
@@ -14,23 +16,39 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.backtest_engine import UniversalBacktestEngine
 from shared.data_connector import DataConnector
+from shared.date_utils import get_weekdays_in_range
 from shared.strategies.dsl_interpreter.dsl_loader import load_dsl_strategy
 import json
 
-def get_weekdays_in_range(start_date, end_date):
-    """Get all weekdays (Mon-Fri) between start and end dates."""
-    weekdays = []
-    current = start_date
-    
-    while current <= end_date:
-        # 0 = Monday, 6 = Sunday
-        if current.weekday() < 5:  # Monday to Friday
-            weekdays.append(current)
-        current += timedelta(days=1)
-    
-    return weekdays
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def run_backtest_for_date(date_str, strategy_name="Stochastic Quad Rotation", 
+# Optimal SL/TP configuration
+STOP_LOSS_PIPS = 15
+TAKE_PROFIT_PIPS = 15
+
+# Per-process data connector and engine
+_worker_state = None
+
+
+def get_worker_state():
+    """Build the data connector and engine once per process."""
+    global _worker_state
+    if _worker_state is None:
+        data_connector = DataConnector()
+        engine = UniversalBacktestEngine(data_connector)
+        _worker_state = (data_connector, engine)
+    return _worker_state
+
+
+def init_worker():
+    """Pool initializer: build this worker's data connector and engine up front."""
+    get_worker_state()
+
+
+def run_backtest_for_date(date_str, strategy_name="Stochastic Quad Rotation",
                           symbol="US500_SB", timeframe="1m",
                           stop_loss_pips=15, take_profit_pips=15):
     """Run a single backtest for a specific date."""
@@ -40,16 +58,15 @@ def run_backtest_for_date(date_str, strategy_name="Stochastic Quad Rotation",
     print(f"{'='*80}")
     
     try:
-        # Load strategy
+        data_connector, engine = get_worker_state()
+        
+        # Load a fresh strategy per day so no indicator/trade state carries over
         strategy = load_dsl_strategy(strategy_name)
         
         # Override SL/TP in strategy config
         strategy.stop_loss_pips = stop_loss_pips
         strategy.take_profit_pips = take_profit_pips
         
-        # Initialize data connector
-        data_connector = DataConnector()
-        
         # Fetch data for the single day
         candles = data_connector.fetch_data(
             symbol=symbol,
@@ -65,13 +82,6 @@ def run_backtest_for_date(date_str, strategy_name="Stochastic Quad Rotation",
         print(f"✓ Loaded {len(candles)} candles")
         
         # Run backtest
-        engine = UniversalBacktestEngine(
-            strategy=strategy,
-            data_connector=data_connector,
-            initial_balance=10000,
-            risk_per_trade=0.02
-        )
-        
         results = engine.run_backtest(
             symbol=symbol,
             start_date=date_str,
@@ -119,7 +129,7 @@ def main():
     print(f"Strategy: Stochastic Quad Rotation")
     print(f"Symbol: US500_SB")
     print(f"Timeframe: 1m")
-    print(f"SL/TP: 15/15 pips")
+    print(f"SL/TP: {STOP_LOSS_PIPS}/{TAKE_PROFIT_PIPS} pips")
     print(f"Period: {start_date} to {end_date}")
     print(f"{'='*80}")
     
@@ -127,13 +137,13 @@ def main():
     weekdays = get_weekdays_in_range(start_date, end_date)
     print(f"\nTotal weekdays to test: {len(weekdays)}")
     
-    # Run backtests
-    results = []
-    for date in weekdays:
-        date_str = date.strftime('%Y-%m-%d')
-        result = run_backtest_for_date(date_str)
-        if result:
-            results.append(result)
+    # Run backtests - each day is independent, so fan them out across processes
+    date_strs = [date.strftime('%Y-%m-%d') for date in weekdays]
+    max_workers = max(1, min(os.cpu_count() or 1, len(date_strs)))
+    run_day = partial(run_backtest_for_date,
+                      stop_loss_pips=STOP_LOSS_PIPS, take_profit_pips=TAKE_PROFIT_PIPS)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+        results = [r for r in executor.map(run_day, date_strs) if r]
     
     # Generate summary report
     print(f"\n\n{'='*80}")
@@ -144,16 +154,32 @@ def main():
         print("No results to report")
         return
     
-    # Calculate aggregates
+    # Calculate aggregates in a single pass over the daily results
     total_days = len(results)
-    total_trades = sum(r['trades'] for r in results)
-    total_wins = sum(r['wins'] for r in results)
-    total_losses = sum(r['losses'] for r in results)
-    total_pips = sum(r['total_pips'] for r in results)
-    
-    profitable_days = sum(1 for r in results if r['total_pips'] > 0)
-    losing_days = sum(1 for r in results if r['total_pips'] < 0)
-    breakeven_days = sum(1 for r in results if r['total_pips'] == 0)
+    total_trades = total_wins = total_losses = 0
+    total_pips = 0
+    profitable_days = losing_days = breakeven_days = 0
+    best_day = worst_day = results[0]
+    
+    for r in results:
+        pips = r['total_pips']
+        total_trades += r['trades']
+        total_wins += r['wins']
+        total_losses += r['losses']
+        total_pips += pips
+        
+        if pips > 0:
+            profitable_days += 1
+        elif pips < 0:
+            losing_days += 1
+        else:
+            breakeven_days += 1
+        
+        # Best and worst days (first one wins on ties)
+        if pips > best_day['total_pips']:
+            best_day = r
+        if pips < worst_day['total_pips']:
+            worst_day = r
     
     avg_pips_per_day = total_pips / total_days if total_days > 0 else 0
     overall_win_rate = total_wins / total_trades if total_trades > 0 else 0
@@ -173,10 +199,6 @@ def main():
     print(f"   Total Pips: {total_pips:+.1f}")
     print(f"   Average Pips/Day: {avg_pips_per_day:+.1f}")
     
-    # Best and worst days
-    best_day = max(results, key=lambda x: x['total_pips'])
-    worst_day = min(results, key=lambda x: x['total_pips'])
-    
     print(f"\n🏆 Best Day: {best_day['date']}")
     print(f"   Pips: {best_day['total_pips']:+.1f}")
     print(f"   Trades: {best_day['trades']} ({best_day['wins']}W/{best_day['losses']}L)")
@@ -186,33 +208,40 @@ def main():
     print(f"   Trades: {worst_day['trades']} ({worst_day['wins']}W/{worst_day['losses']}L)")
     
     # Save detailed results to JSON
-    output_file = f"optimization_results/monthly_backtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w') as f:
-        json.dump({
-            'strategy': 'Stochastic Quad Rotation',
-            'symbol': 'US500_SB',
-            'timeframe': '1m',
-            'sl_tp': '15/15',
-            'period': {
-                'start': start_date.strftime('%Y-%m-%d'),
-                'end': end_date.strftime('%Y-%m-%d')
-            },
-            'summary': {
-                'total_days': total_days,
-                'profitable_days': profitable_days,
-                'losing_days': losing_days,
-                'total_trades': total_trades,
-                'total_wins': total_wins,
-                'total_losses': total_losses,
-                'overall_win_rate': overall_win_rate,
-                'total_pips': total_pips,
-                'avg_pips_per_day': avg_pips_per_day
-            },
-            'daily_results': results
-        }, f, indent=2)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = Path(__file__).parent.parent / "optimization_results" / f"monthly_backtest_{timestamp}.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        'strategy': 'Stochastic Quad Rotation',
+        'symbol': 'US500_SB',
+        'timeframe': '1m',
+        'sl_tp': f'{STOP_LOSS_PIPS}/{TAKE_PROFIT_PIPS}',
+        'period': {
+            'start': start_date.strftime('%Y-%m-%d'),
+            'end': end_date.strftime('%Y-%m-%d')
+        },
+        'summary': {
+            'total_days': total_days,
+            'profitable_days': profitable_days,
+            'losing_days': losing_days,
+            'total_trades': total_trades,
+            'total_wins': total_wins,
+            'total_losses': total_losses,
+            'overall_win_rate': overall_win_rate,
+            'total_pips': total_pips,
+            'avg_pips_per_day': avg_pips_per_day
+        },
+        'daily_results': results
+    }
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\n📁 Detailed results saved to: {output_file}")
     print(f"\n{'='*80}\n")
+    return output_file
 
 if __name__ == '__main__':
     main()
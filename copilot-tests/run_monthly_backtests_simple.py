@@ -4,22 +4,17 @@ Run individual backtests for every weekday in the past month using MCP tool.
 Uses the optimal 15/15 SL/TP configuration.
 """
 
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 import subprocess
 import json
 
-def get_weekdays_in_range(start_date, end_date):
-    """Get all weekdays (Mon-Fri) between start and end dates."""
-    weekdays = []
-    current = start_date
-    
-    while current <= end_date:
-        # 0 = Monday, 6 = Sunday
-        if current.weekday() < 5:  # Monday to Friday
-            weekdays.append(current)
-        current += timedelta(days=1)
-    
-    return weekdays
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.date_utils import get_weekdays_in_range
+
 
 def main():
     """Run backtests for every weekday in the past month."""
@@ -15,6 +15,7 @@ Options:
     --end-date DATE         End date YYYY-MM-DD (default: today)
     --stop-loss PIPS        Stop loss in pips (default: 15.0)
     --take-profit PIPS      Take profit in pips (default: 25.0)
+    --debug                 Print full tracebacks on failure
     --help                  Show this help message
 
 Examples:
@@ -38,6 +39,13 @@ import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -68,10 +76,6 @@ Examples:
         """
     )
     
-    # Calculate default dates
-    default_end = datetime.now()
-    default_start = default_end - timedelta(days=7)
-    
     parser.add_argument(
         '--symbol',
         type=str,
@@ -90,15 +94,15 @@ Examples:
     parser.add_argument(
         '--start-date',
         type=str,
-        default=default_start.strftime('%Y-%m-%d'),
-        help=f'Start date in YYYY-MM-DD format (default: {default_start.strftime("%Y-%m-%d")})'
+        default=None,
+        help='Start date in YYYY-MM-DD format (default: 7 days ago)'
     )
     
     parser.add_argument(
         '--end-date',
         type=str,
-        default=default_end.strftime('%Y-%m-%d'),
-        help=f'End date in YYYY-MM-DD format (default: {default_end.strftime("%Y-%m-%d")})'
+        default=None,
+        help='End date in YYYY-MM-DD format (default: today)'
     )
     
     parser.add_argument(
@@ -115,7 +119,23 @@ Examples:
         help='Take profit in pips (default: 25.0)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Print full tracebacks when the backtest fails'
+    )
+    
+    args = parser.parse_args()
+    
+    # Resolve date defaults only when they were not given
+    if args.start_date is None or args.end_date is None:
+        default_end = datetime.now()
+        if args.end_date is None:
+            args.end_date = default_end.strftime('%Y-%m-%d')
+        if args.start_date is None:
+            args.start_date = (default_end - timedelta(days=7)).strftime('%Y-%m-%d')
+    
+    return args
 
 
 async def run_manual_backtest(args):
@@ -129,8 +149,8 @@ async def run_manual_backtest(args):
     print("\n1. Loading Stochastic Quad Rotation strategy...")
     strategy_path = Path(__file__).parent.parent / "shared" / "strategies" / "dsl_strategies" / "stochastic_quad_rotation.json"
     
-    with open(strategy_path, 'r') as f:
-        strategy_config = json.load(f)
+    raw = strategy_path.read_bytes()
+    strategy_config = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     strategy = DSLStrategy(strategy_config)
     print(f"   ✓ Strategy loaded: {strategy.get_name()} v{strategy.get_version()}")
@@ -233,15 +253,20 @@ async def run_manual_backtest(args):
             print(f"{'#':<4} {'Entry Time':<20} {'Dir':<5} {'Entry':<10} {'Exit':<10} {'Pips':<8} {'Result':<10}")
             print("-" * 80)
             
-            for i, trade in enumerate(results.trades[:10], 1):  # Show first 10 trades
-                entry_time_str = trade.entry_time.strftime('%Y-%m-%d %H:%M')
+            shown_trades = results.trades[:10]  # Show first 10 trades
+            # Format all entry times in one vectorized call
+            entry_time_strs = pd.DatetimeIndex([trade.entry_time for trade in shown_trades]).strftime('%Y-%m-%d %H:%M')
+            
+            rows = []
+            for i, (trade, entry_time_str) in enumerate(zip(shown_trades, entry_time_strs), 1):
                 direction_str = trade.direction.name
                 entry_price_str = f"{trade.entry_price:.5f}"
                 exit_price_str = f"{trade.exit_price:.5f}" if trade.exit_price else "N/A"
                 pips_str = f"{trade.pips:+.1f}" if trade.pips else "N/A"
                 result_str = trade.result.name if trade.result else "OPEN"
                 
-                print(f"{i:<4} {entry_time_str:<20} {direction_str:<5} {entry_price_str:<10} {exit_price_str:<10} {pips_str:<8} {result_str:<10}")
+                rows.append(f"{i:<4} {entry_time_str:<20} {direction_str:<5} {entry_price_str:<10} {exit_price_str:<10} {pips_str:<8} {result_str:<10}")
+            print("\n".join(rows))
             
             if len(results.trades) > 10:
                 print(f"... and {len(results.trades) - 10} more trades")
@@ -254,8 +279,9 @@ async def run_manual_backtest(args):
         
     except Exception as e:
         print(f"\n❌ Backtest failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.debug:
+            import traceback
+            traceback.print_exc()
         return None
 
 
@@ -30,7 +30,7 @@ def test_existing_strategies():
     ]
     
     registry = get_strategy_registry()
-    available = registry.list_strategies()
+    available = frozenset(registry.list_strategies())
     
     print(f"\nTotal strategies available: {len(available)}")
     print(f"Strategies to test: {len(existing_strategies)}")
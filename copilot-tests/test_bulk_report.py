@@ -1,3 +1,5 @@
+import sys
+
 from shared.bulk_backtest_report import BulkBacktestReportGenerator
 
 # Test report generation
@@ -28,6 +30,7 @@ try:
     )
     print(f"✅ Report generated: {report_path}")
 except Exception as e:
-    import traceback
     print(f"❌ Error: {e}")
-    print(traceback.format_exc())
+    if '--debug' in sys.argv:
+        import traceback
+        print(traceback.format_exc())
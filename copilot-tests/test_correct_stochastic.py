@@ -4,37 +4,61 @@ Calculate stochastic using the correct cTrader data at 10:28 UTC-5.
 """
 
 import json
-import pandas as pd
-from datetime import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared._stoch_jit import stoch_kd
 
 # Load cTrader data
-with open('cTraderData.json', 'r') as f:
-    data = json.load(f)
+raw = Path('cTraderData.json').read_bytes()
+data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 candles = data['data']
 
-# Convert to DataFrame
-df = pd.DataFrame([{
-    'timestamp': datetime.utcfromtimestamp(c['timestamp'] / 1000),
-    'open': c['open'],
-    'high': c['high'],
-    'low': c['low'],
-    'close': c['close'],
-    'volume': c['volume']
-} for c in candles])
-
-# Find 10:28 UTC-5 (which is 15:28 UTC)
-target_time = datetime(2025, 12, 11, 15, 28)
-target_idx = df[df['timestamp'] == target_time].index
-
-if len(target_idx) == 0:
+# One pass over the candles into a float64 matrix; only timestamps and H/L/C are used
+# (ms timestamps are well below 2**53, so they round-trip through float64 exactly)
+fields = ('timestamp', 'high', 'low', 'close')
+rows = np.array([tuple(c[field] for field in fields) for c in candles], dtype=np.float64).reshape(-1, len(fields))
+timestamps_ms = rows[:, 0].astype(np.int64)
+if np.any(timestamps_ms[1:] < timestamps_ms[:-1]):
+    order = np.argsort(timestamps_ms, kind='stable')
+    rows = rows[order]
+    timestamps_ms = timestamps_ms[order]
+
+# Find 10:28 UTC-5 (which is 15:28 UTC) with a binary search on the sorted timestamps
+target_time = datetime(2025, 12, 11, 15, 28, tzinfo=timezone.utc)
+target_ms = int(target_time.timestamp() * 1000)
+target_idx = int(np.searchsorted(timestamps_ms, target_ms))
+
+if target_idx == len(timestamps_ms) or timestamps_ms[target_idx] != target_ms:
     print("Target time not found!")
     exit(1)
 
-target_idx = target_idx[0]
+# Raw price arrays shared by every config. float32 is plenty for an eyeball check
+# and halves the bandwidth of the window scans; TA-Lib only accepts float64.
+price_dtype = np.float64 if talib is not None else np.float32
+highs = np.ascontiguousarray(rows[:, 1], dtype=price_dtype)
+lows = np.ascontiguousarray(rows[:, 2], dtype=price_dtype)
+closes = np.ascontiguousarray(rows[:, 3], dtype=price_dtype)
 
 print(f"Found 10:28 (UTC-5) at index {target_idx}")
-print(f"Close: {df.loc[target_idx, 'close']:.2f}\n")
+print(f"Close: {closes[target_idx]:.2f}\n")
 
 # Calculate all 4 stochastics
 stoch_configs = [
@@ -46,33 +70,41 @@ stoch_configs = [
 
 print("=== Stochastic Values at 10:28 (UTC-5) ===\n")
 
-for config in stoch_configs:
-    name = config['name']
+
+def compute_stoch(config):
+    """Return (%K, %D) at the target bar for one config, or None without enough history."""
     k_period = config['k_period']
     k_smoothing = config['k_smoothing']
     d_smoothing = config['d_smoothing']
     
-    # Calculate stochastic
-    df_calc = df.copy()
-    df_calc['lowest_low'] = df_calc['low'].rolling(window=k_period).min()
-    df_calc['highest_high'] = df_calc['high'].rolling(window=k_period).max()
-    df_calc['range'] = df_calc['highest_high'] - df_calc['lowest_low']
-    df_calc['range'] = df_calc['range'].replace(0, 1e-10)
-    df_calc['k_raw'] = ((df_calc['close'] - df_calc['lowest_low']) / df_calc['range']) * 100
+    if talib is not None:
+        # TA-Lib keeps running min/max in C; SMA (matype 0) smoothing for %K and %D
+        slowk, slowd = talib.STOCH(highs, lows, closes, fastk_period=k_period,
+                                   slowk_period=k_smoothing, slowk_matype=0,
+                                   slowd_period=d_smoothing, slowd_matype=0)
+        return slowk[target_idx], slowd[target_idx]
     
-    # Apply %K smoothing
-    if k_smoothing > 1:
-        df_calc['k'] = df_calc['k_raw'].rolling(window=k_smoothing).mean()
-    else:
-        df_calc['k'] = df_calc['k_raw']
-    
-    # Calculate %D
-    df_calc['d'] = df_calc['k'].rolling(window=d_smoothing).mean()
-    
-    k_value = df_calc.loc[target_idx, 'k']
-    d_value = df_calc.loc[target_idx, 'd']
-    
-    print(f"{name:12} ({k_period:2},{k_smoothing},{d_smoothing:2}): %K={k_value:6.2f}  %D={d_value:6.2f}")
+    # Only the bars feeding %D at the target are needed
+    tail = k_period + k_smoothing + d_smoothing - 2
+    start = target_idx - tail + 1
+    if start < 0:
+        return None
+    k, d = stoch_kd(highs[start:target_idx + 1], lows[start:target_idx + 1],
+                    closes[start:target_idx + 1], k_period, k_smoothing, d_smoothing)
+    return k[-1], d[-1]
+
+
+# Configs are independent reads of the same arrays; map() keeps the print order
+with ThreadPoolExecutor(max_workers=len(stoch_configs)) as executor:
+    stoch_values = list(executor.map(compute_stoch, stoch_configs))
+
+for config, values in zip(stoch_configs, stoch_values):
+    label = f"{config['name']:12} ({config['k_period']:2},{config['k_smoothing']},{config['d_smoothing']:2})"
+    if values is None:
+        print(f"{label}: not enough history")
+        continue
+    k_value, d_value = values
+    print(f"{label}: %K={k_value:6.2f}  %D={d_value:6.2f}")
 
 print("\n=== TradingView Values (from CSV) ===")
 print("Stoch 1:  %D = 89.65")
@@ -10,11 +10,18 @@ Tests:
 5. Length checking for indicator data vs candle data
 """
 
-import sys
+import asyncio
+import functools
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -40,29 +47,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_test_candles(count: int = 100) -> list:
-    """Create test candle data."""
-    candles = []
+@functools.lru_cache(maxsize=4)
+def _test_candle_rows(count: int) -> tuple:
+    """Build the candle rows once per count; tests only read them."""
     base_time = datetime(2024, 1, 1, 9, 0)
     base_price = 1.1000
     
-    for i in range(count):
-        timestamp = base_time + timedelta(minutes=15 * i)
-        open_price = base_price + (i * 0.0001)
-        high_price = open_price + 0.0005
-        low_price = open_price - 0.0003
-        close_price = open_price + 0.0002
-        
-        candles.append(Candle(
-            timestamp=timestamp,
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=1000 + i * 10
-        ))
+    i = np.arange(count)
+    opens = base_price + i * 0.0001
+    highs = opens + 0.0005
+    lows = opens - 0.0003
+    closes = opens + 0.0002
+    volumes = 1000 + i * 10
     
-    return candles
+    timestamps = [base_time + timedelta(minutes=15 * k) for k in range(count)]
+    return tuple(Candle.from_arrays(timestamps, opens, highs, lows, closes, volumes))
+
+
+def create_test_candles(count: int = 100) -> list:
+    """Create test candle data."""
+    return list(_test_candle_rows(count))
 
 
 def create_test_trades() -> list:
@@ -93,7 +97,7 @@ def create_test_trades() -> list:
     return trades
 
 
-def create_test_backtest_results(trades: list) -> BacktestResults:
+def create_test_backtest_results(trades: list, strategy_name: str = "Test Strategy") -> BacktestResults:
     """Create a complete BacktestResults object."""
     config = BacktestConfiguration(
         symbol="EURUSD",
@@ -107,7 +111,7 @@ def create_test_backtest_results(trades: list) -> BacktestResults:
     total_pips = sum(t.pips for t in trades)
     
     return BacktestResults(
-        strategy_name="Test Strategy",
+        strategy_name=strategy_name,
         strategy_version="1.0.0",
         configuration=config,
         trades=trades,
@@ -132,16 +136,40 @@ def create_test_backtest_results(trades: list) -> BacktestResults:
     )
 
 
+# ChartEngine keeps per-chart state (_current_layout, _current_indicators),
+# so one instance is reused per worker thread rather than shared across them
+_engine_local = threading.local()
+
+
+def get_chart_engine() -> ChartEngine:
+    """Return this thread's ChartEngine, creating it on first use."""
+    engine = getattr(_engine_local, 'engine', None)
+    if engine is None:
+        engine = _engine_local.engine = ChartEngine()
+    return engine
+
+
+# Shared read-only fixtures, built once for all tests
+_CANDLES = create_test_candles(50)
+_TRADES = create_test_trades()
+# The tests run concurrently and the chart file name is
+# <symbol>_<strategy>_<second>, so each chart-writing test gets its own
+# strategy name to keep two threads from writing the same file
+_RESULTS = {
+    test: create_test_backtest_results(_TRADES, f"Test Strategy {test}")
+    for test in (1, 3, 4, 5)
+}
+
+
 def test_1_missing_metadata_fallback():
     """Test 1: Metadata lookup with fallback to OVERLAY type."""
     logger.info("\n" + "="*80)
     logger.info("TEST 1: Missing metadata fallback to OVERLAY")
     logger.info("="*80)
     
-    engine = ChartEngine()
-    candles = create_test_candles(50)
-    trades = create_test_trades()
-    backtest_results = create_test_backtest_results(trades)
+    engine = get_chart_engine()
+    candles = _CANDLES
+    backtest_results = _RESULTS[1]
     
     # Create indicators with an unknown indicator (should fallback to OVERLAY)
     indicators = {
@@ -233,10 +261,9 @@ def test_3_indicator_length_mismatch():
     logger.info("TEST 3: Indicator data length mismatch handling")
     logger.info("="*80)
     
-    engine = ChartEngine()
-    candles = create_test_candles(50)
-    trades = create_test_trades()
-    backtest_results = create_test_backtest_results(trades)
+    engine = get_chart_engine()
+    candles = _CANDLES
+    backtest_results = _RESULTS[3]
     
     # Create indicators with mismatched lengths
     indicators = {
@@ -265,16 +292,14 @@ def test_4_subplot_creation_fallback():
     logger.info("TEST 4: Subplot creation fallback")
     logger.info("="*80)
     
-    engine = ChartEngine()
-    candles = create_test_candles(50)
-    trades = create_test_trades()
-    backtest_results = create_test_backtest_results(trades)
+    engine = get_chart_engine()
+    candles = _CANDLES
+    backtest_results = _RESULTS[4]
     
     # Test with many oscillators (stress test)
-    indicators = {
-        f"MACD_{i}": [0.001 * i + j * 0.0001 for j in range(50)]
-        for i in range(10)  # 10 MACD indicators
-    }
+    # 10 MACD indicators, one row each: 0.001 * i + j * 0.0001
+    macd_values = 0.001 * np.arange(10)[:, None] + np.arange(50)[None, :] * 0.0001
+    indicators = {f"MACD_{i}": row for i, row in enumerate(macd_values.tolist())}
     
     try:
         chart_path = engine.create_comprehensive_chart(
@@ -296,10 +321,9 @@ def test_5_empty_and_invalid_indicators():
     logger.info("TEST 5: Empty and invalid indicator data")
     logger.info("="*80)
     
-    engine = ChartEngine()
-    candles = create_test_candles(50)
-    trades = create_test_trades()
-    backtest_results = create_test_backtest_results(trades)
+    engine = get_chart_engine()
+    candles = _CANDLES
+    backtest_results = _RESULTS[5]
     
     # Create indicators with various invalid data
     indicators = {
@@ -327,19 +351,27 @@ def test_5_empty_and_invalid_indicators():
         return False
 
 
-def main():
+async def main():
     """Run all error handling tests."""
     logger.info("\n" + "="*80)
     logger.info("INDICATOR CHARTING SYSTEM - ERROR HANDLING TESTS")
     logger.info("="*80)
     
-    results = {
-        "Test 1: Missing metadata fallback": test_1_missing_metadata_fallback(),
-        "Test 2: Metadata validation": test_2_metadata_validation(),
-        "Test 3: Indicator length mismatch": test_3_indicator_length_mismatch(),
-        "Test 4: Subplot creation fallback": test_4_subplot_creation_fallback(),
-        "Test 5: Empty/invalid indicators": test_5_empty_and_invalid_indicators()
-    }
+    tests = [
+        ("Test 1: Missing metadata fallback", test_1_missing_metadata_fallback),
+        ("Test 2: Metadata validation", test_2_metadata_validation),
+        ("Test 3: Indicator length mismatch", test_3_indicator_length_mismatch),
+        ("Test 4: Subplot creation fallback", test_4_subplot_creation_fallback),
+        ("Test 5: Empty/invalid indicators", test_5_empty_and_invalid_indicators)
+    ]
+    
+    # Each worker thread uses its own ChartEngine (get_chart_engine) and each test
+    # writes its own chart file, so chart rendering and file I/O can overlap
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)))
+    names, funcs = zip(*tests)
+    outcomes = await asyncio.gather(*(asyncio.to_thread(func) for func in funcs))
+    results = dict(zip(names, outcomes))
     
     # Summary
     logger.info("\n" + "="*80)
@@ -364,4 +396,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
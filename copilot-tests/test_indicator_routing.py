@@ -6,7 +6,12 @@ This test verifies that indicators are correctly routed to appropriate subplots
 based on their metadata (overlay vs oscillator).
 """
 
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
+from functools import lru_cache
+import numpy as np
 from shared.chart_engine import ChartEngine
 from shared.models import Candle, Trade, TradeDirection
 from shared.strategy_interface import BacktestResults
@@ -16,21 +21,32 @@ import plotly.graph_objects as go
 
 def create_test_candles(count=100):
     """Create test candle data."""
-    candles = []
     base_time = datetime(2024, 1, 1, 9, 0)
     base_price = 1.15
     
-    for i in range(count):
-        candles.append(Candle(
-            timestamp=base_time + timedelta(minutes=i*15),
-            open=base_price + (i * 0.0001),
-            high=base_price + (i * 0.0001) + 0.0005,
-            low=base_price + (i * 0.0001) - 0.0005,
-            close=base_price + (i * 0.0001) + 0.0002,
-            volume=1000 + i
-        ))
-    
-    return candles
+    i = np.arange(count)
+    base = base_price + (i * 0.0001)
+    timestamps = [base_time + timedelta(minutes=k*15) for k in range(count)]
+    
+    return Candle.from_arrays(timestamps, base, base + 0.0005, base - 0.0005, base + 0.0002, 1000 + i)
+
+
+# Shared by every test; built once at import instead of per test
+TIMESTAMPS = tuple(datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100))
+
+
+@lru_cache(maxsize=None)
+def _series(start, step, count=100):
+    """Linear indicator series ``start + i * step``, cached as a read-only float64 array."""
+    series = start + np.arange(count) * step
+    series.flags.writeable = False
+    return series
+
+
+def _horizontal_lines(fig):
+    """Horizontal line shapes as plain dicts, read once from the raw layout."""
+    shapes = fig.layout.to_plotly_json().get('shapes', ())
+    return [shape for shape in shapes if shape.get('type') == 'line' and shape.get('y0') == shape.get('y1')]
 
 
 def create_test_backtest_results():
@@ -69,9 +85,9 @@ def test_route_overlay_to_price_chart():
     
     # Create test data
     indicators = {
-        "SMA20": [1.15 + (i * 0.0001) for i in range(100)],
-        "EMA50": [1.14 + (i * 0.0001) for i in range(100)],
-        "VWAP": [1.155 + (i * 0.0001) for i in range(100)]
+        "SMA20": _series(1.15, 0.0001),
+        "EMA50": _series(1.14, 0.0001),
+        "VWAP": _series(1.155, 0.0001)
     }
     
     # Determine layout
@@ -81,12 +97,11 @@ def test_route_overlay_to_price_chart():
     fig = make_subplots(rows=3, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
-    # Route each indicator
-    for indicator_name, values in indicators.items():
-        print(f"\nRouting {indicator_name}...")
-        engine._route_indicator_to_subplot(fig, indicator_name, values, timestamps, layout)
+    # Route all indicators
+    print(f"\nRouting {', '.join(indicators)}...")
+    engine._route_indicators(fig, indicators, timestamps, layout)
     
     # Verify all overlays were added to price chart (row 1)
     price_traces = [trace for trace in fig.data if trace.xaxis == 'x']
@@ -108,8 +123,8 @@ def test_route_oscillator_to_separate_subplot():
     
     # Create test data
     indicators = {
-        "MACD": [0.001 + (i * 0.00001) for i in range(100)],
-        "RSI": [50.0 + (i * 0.1) for i in range(100)]
+        "MACD": _series(0.001, 0.00001),
+        "RSI": _series(50.0, 0.1)
     }
     
     # Determine layout
@@ -121,12 +136,11 @@ def test_route_oscillator_to_separate_subplot():
     fig = make_subplots(rows=total_rows, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
-    # Route each indicator
-    for indicator_name, values in indicators.items():
-        print(f"\nRouting {indicator_name}...")
-        engine._route_indicator_to_subplot(fig, indicator_name, values, timestamps, layout)
+    # Route all indicators
+    print(f"\nRouting {', '.join(indicators)}...")
+    engine._route_indicators(fig, indicators, timestamps, layout)
     
     # Verify oscillators were added to separate subplots
     print(f"\nTotal traces in figure: {len(fig.data)}")
@@ -148,7 +162,7 @@ def test_reference_lines_added():
     
     # Create test data with RSI (has reference lines at 30 and 70)
     indicators = {
-        "RSI": [50.0 + (i * 0.1) for i in range(100)]
+        "RSI": _series(50.0, 0.1)
     }
     
     # Determine layout
@@ -159,14 +173,14 @@ def test_reference_lines_added():
     fig = make_subplots(rows=total_rows, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
     # Route RSI
     print("\nRouting RSI (should add reference lines at 30 and 70)...")
     engine._route_indicator_to_subplot(fig, "RSI", indicators["RSI"], timestamps, layout)
     
     # Check for horizontal lines (reference lines)
-    hlines = [shape for shape in fig.layout.shapes if shape.type == 'line' and shape.y0 == shape.y1]
+    hlines = _horizontal_lines(fig)
     print(f"\nHorizontal lines found: {len(hlines)}")
     
     # RSI should have 2 reference lines (30 and 70)
@@ -186,7 +200,7 @@ def test_zero_line_added():
     
     # Create test data with MACD (has zero line)
     indicators = {
-        "MACD": [0.001 + (i * 0.00001) for i in range(100)]
+        "MACD": _series(0.001, 0.00001)
     }
     
     # Determine layout
@@ -197,21 +211,21 @@ def test_zero_line_added():
     fig = make_subplots(rows=total_rows, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
     # Route MACD
     print("\nRouting MACD (should add zero line)...")
     engine._route_indicator_to_subplot(fig, "MACD", indicators["MACD"], timestamps, layout)
     
     # Check for horizontal lines
-    hlines = [shape for shape in fig.layout.shapes if shape.type == 'line' and shape.y0 == shape.y1]
+    hlines = _horizontal_lines(fig)
     print(f"\nHorizontal lines found: {len(hlines)}")
     
     # MACD should have 1 zero line
     assert len(hlines) >= 1, f"Expected at least 1 zero line for MACD, got {len(hlines)}"
     
     # Check if one of the lines is at y=0
-    zero_lines = [line for line in hlines if line.y0 == 0]
+    zero_lines = [line for line in hlines if line.get('y0') == 0]
     assert len(zero_lines) >= 1, "Expected a zero line at y=0"
     
     print("✓ Zero line added for MACD")
@@ -228,7 +242,7 @@ def test_fixed_scale_applied():
     
     # Create test data with RSI (has fixed scale 0-100)
     indicators = {
-        "RSI": [50.0 + (i * 0.1) for i in range(100)]
+        "RSI": _series(50.0, 0.1)
     }
     
     # Determine layout
@@ -239,7 +253,7 @@ def test_fixed_scale_applied():
     fig = make_subplots(rows=total_rows, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
     # Route RSI
     print("\nRouting RSI (should apply fixed scale 0-100)...")
@@ -272,10 +286,10 @@ def test_mixed_indicators():
     
     # Create test data with both overlays and oscillators
     indicators = {
-        "SMA20": [1.15 + (i * 0.0001) for i in range(100)],
-        "MACD": [0.001 + (i * 0.00001) for i in range(100)],
-        "VWAP": [1.155 + (i * 0.0001) for i in range(100)],
-        "RSI": [50.0 + (i * 0.1) for i in range(100)]
+        "SMA20": _series(1.15, 0.0001),
+        "MACD": _series(0.001, 0.00001),
+        "VWAP": _series(1.155, 0.0001),
+        "RSI": _series(50.0, 0.1)
     }
     
     # Determine layout
@@ -287,12 +301,11 @@ def test_mixed_indicators():
     fig = make_subplots(rows=total_rows, cols=1)
     
     # Create timestamps
-    timestamps = [datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i*15) for i in range(100)]
+    timestamps = TIMESTAMPS
     
-    # Route each indicator
-    for indicator_name, values in indicators.items():
-        print(f"\nRouting {indicator_name}...")
-        engine._route_indicator_to_subplot(fig, indicator_name, values, timestamps, layout)
+    # Route all indicators
+    print(f"\nRouting {', '.join(indicators)}...")
+    engine._route_indicators(fig, indicators, timestamps, layout)
     
     print(f"\nTotal traces: {len(fig.data)}")
     
@@ -303,13 +316,30 @@ def test_mixed_indicators():
     print("=" * 70)
 
 
+ROUTING_TESTS = [
+    test_route_overlay_to_price_chart,
+    test_route_oscillator_to_separate_subplot,
+    test_reference_lines_added,
+    test_zero_line_added,
+    test_fixed_scale_applied,
+    test_mixed_indicators,
+]
+
+
+def _run_captured(test):
+    """Run one test in a worker, returning its printed output for in-order display."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        test()
+    return buffer.getvalue()
+
+
 if __name__ == "__main__":
-    test_route_overlay_to_price_chart()
-    test_route_oscillator_to_separate_subplot()
-    test_reference_lines_added()
-    test_zero_line_added()
-    test_fixed_scale_applied()
-    test_mixed_indicators()
+    # The tests are independent, so run them across processes; under pytest,
+    # use pytest-xdist instead: pytest -n auto copilot-tests/test_indicator_routing.py
+    with ProcessPoolExecutor() as executor:
+        for output in executor.map(_run_captured, ROUTING_TESTS):
+            print(output, end="")
     
     print("\n" + "=" * 70)
     print("ALL ROUTING TESTS PASSED! ✓✓✓")
@@ -8,15 +8,24 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
-import pandas as pd
+import numpy as np
 from datetime import datetime
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+from shared._stoch_jit import stoch_k
+
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+])
+
 
 async def test_inverted_stochastic():
     """Test inverted stochastic formula."""
     
     # Fetch 1m data for today
-    connector = DataConnector()
+    connector = get_data_connector()
     
     response = await connector.get_market_data(
         symbol="US500_SB",
@@ -25,50 +34,40 @@ async def test_inverted_stochastic():
         end_date=datetime(2025, 12, 11)
     )
     
-    # Convert to DataFrame
-    df = pd.DataFrame([{
-        'timestamp': c.timestamp,
-        'open': c.open,
-        'high': c.high,
-        'low': c.low,
-        'close': c.close,
-        'volume': c.volume
-    } for c in response.data])
-    
-    df = df.sort_values('timestamp')
+    # One pass over the candles into a structured array; the rolling
+    # reduction below runs on its columns directly
+    candles = response.data
+    rows = np.fromiter(((c.timestamp, c.high, c.low, c.close) for c in candles),
+                       dtype=CANDLE_DTYPE, count=len(candles))
+    rows = rows[np.argsort(rows['timestamp'], kind='stable')]
+    count = len(rows)
+    timestamps, highs, lows, closes = rows['timestamp'], rows['high'], rows['low'], rows['close']
     
     # Find 10:28
-    target_time = datetime(2025, 12, 11, 10, 28)
-    target_idx = df[df['timestamp'] == target_time].index[0]
+    target_time = np.datetime64(datetime(2025, 12, 11, 10, 28), 'us')
+    target_idx = int(np.searchsorted(timestamps, target_time))
+    if target_idx == count or timestamps[target_idx] != target_time:
+        raise IndexError(f"No candle at {target_time}")
     
     print(f"Testing at 10:28 (index {target_idx})")
-    print(f"Close: {df.loc[target_idx, 'close']:.2f}\n")
+    print(f"Close: {closes[target_idx]:.2f}\n")
     
     # Test fast stochastic (9,1,3)
     k_period = 9
     
-    df_calc = df.copy()
-    df_calc['lowest_low'] = df_calc['low'].rolling(window=k_period).min()
-    df_calc['highest_high'] = df_calc['high'].rolling(window=k_period).max()
-    df_calc['range'] = df_calc['highest_high'] - df_calc['lowest_low']
-    df_calc['range'] = df_calc['range'].replace(0, 1e-10)
-    
-    # Standard formula
-    df_calc['k_standard'] = ((df_calc['close'] - df_calc['lowest_low']) / df_calc['range']) * 100
-    
-    # Inverted formula
-    df_calc['k_inverted'] = ((df_calc['highest_high'] - df_calc['close']) / df_calc['range']) * 100
+    k_standard, k_inverted = stoch_k(lows, highs, closes, k_period)
     
     # Alternative: 100 - standard
-    df_calc['k_complement'] = 100 - df_calc['k_standard']
+    k_complement = 100 - k_standard
     
-    standard = df_calc.loc[target_idx, 'k_standard']
-    inverted = df_calc.loc[target_idx, 'k_inverted']
-    complement = df_calc.loc[target_idx, 'k_complement']
+    standard = k_standard[target_idx]
+    inverted = k_inverted[target_idx]
+    complement = k_complement[target_idx]
     
-    lowest = df_calc.loc[target_idx, 'lowest_low']
-    highest = df_calc.loc[target_idx, 'highest_high']
-    close = df_calc.loc[target_idx, 'close']
+    window = slice(max(target_idx - k_period + 1, 0), target_idx + 1)
+    lowest = lows[window].min()
+    highest = highs[window].max()
+    close = closes[target_idx]
     
     print(f"Range: Low={lowest:.2f}, High={highest:.2f}, Close={close:.2f}")
     print(f"\nStandard formula:  %K = {standard:.2f}")
@@ -78,16 +77,17 @@ async def test_inverted_stochastic():
     
     # Check which matches
     tv_value = 89.65
-    diff_standard = abs(standard - tv_value)
-    diff_inverted = abs(inverted - tv_value)
-    diff_complement = abs(complement - tv_value)
+    formulas = ("Standard", "Inverted", "Complement")
+    diffs = np.abs(np.array([standard, inverted, complement]) - tv_value)
+    best = int(np.argmin(diffs))
     
     print(f"\nDifferences from TradingView:")
-    print(f"Standard:   {diff_standard:.2f}")
-    print(f"Inverted:   {diff_inverted:.2f}")
-    print(f"Complement: {diff_complement:.2f}")
+    for formula, diff in zip(formulas, diffs):
+        print(f"{formula + ':':<11} {diff:.2f}")
+    print(f"Closest: {formulas[best]}")
     
-    if diff_complement < 5:
+    # Inverted and complement agree up to rounding, so test the complement directly
+    if diffs[formulas.index("Complement")] < 5:
         print(f"\n✅ MATCH! TradingView appears to use: 100 - standard_stochastic")
         print(f"   This means we need to invert our calculation!")
 
@@ -4,11 +4,12 @@ Direct test of MACD backtest to debug indicator issues
 """
 
 import asyncio
+from dataclasses import fields
 from datetime import datetime, timedelta
 from shared.backtest_engine import UniversalBacktestEngine
 from shared.strategy_registry import StrategyRegistry
 from shared.strategy_interface import BacktestConfiguration
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
 
 async def main():
     print("=" * 80)
@@ -16,7 +17,7 @@ async def main():
     print("=" * 80)
     
     # Initialize components
-    connector = DataConnector()
+    connector = get_data_connector()
     registry = StrategyRegistry()
     engine = UniversalBacktestEngine(data_connector=connector)
     
@@ -63,11 +64,11 @@ async def main():
                 print(f"       First 5: {values[:5]}")
     else:
         print(f"   ❌ No indicators in results!")
-        print(f"   Results attributes: {dir(results)}")
+        print(f"   Results fields: {[field.name for field in fields(results)]}")
     
-    # Check to_dict
+    # Check to_dict (indicators don't depend on market data, so skip serializing every candle)
     print(f"\n5. Checking to_dict()...")
-    results_dict = results.to_dict(include_market_data=True)
+    results_dict = results.to_dict(include_market_data=False)
     if 'indicators' in results_dict:
         print(f"   ✓ Indicators in dict: {list(results_dict['indicators'].keys())}")
     else:
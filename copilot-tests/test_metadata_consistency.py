@@ -17,31 +17,25 @@ from shared.indicators_metadata import metadata_registry
 def test_calculator_metadata_matches_registry():
     """Test that calculator metadata matches registry metadata."""
     
-    calculators = [
-        ("VWAP", VWAPCalculator()),
-        ("SMA", SMACalculator(20)),
-        ("EMA", EMACalculator(20)),
-        ("RSI", RSICalculator(14)),
-        ("MACD", MACDCalculator(12, 26, 9))
-    ]
+    # Metadata doesn't depend on calculator parameters, so query the classes directly
+    calculators = {
+        "VWAP": VWAPCalculator,
+        "SMA": SMACalculator,
+        "EMA": EMACalculator,
+        "RSI": RSICalculator,
+        "MACD": MACDCalculator
+    }
     
-    for base_name, calculator in calculators:
+    for base_name, calculator in calculators.items():
         calc_metadata = calculator.get_chart_config()
         registry_metadata = metadata_registry.get(base_name)
         
-        # Both should return the same object (or at least equivalent data)
         assert calc_metadata is not None, f"{base_name}: Calculator metadata is None"
         assert registry_metadata is not None, f"{base_name}: Registry metadata is None"
         
-        # Check that they're the same object or have the same values
-        assert calc_metadata.name == registry_metadata.name, \
-            f"{base_name}: Name mismatch - calc: {calc_metadata.name}, registry: {registry_metadata.name}"
-        
-        assert calc_metadata.indicator_type == registry_metadata.indicator_type, \
-            f"{base_name}: Type mismatch - calc: {calc_metadata.indicator_type}, registry: {registry_metadata.indicator_type}"
-        
-        assert calc_metadata.scale_type == registry_metadata.scale_type, \
-            f"{base_name}: Scale type mismatch - calc: {calc_metadata.scale_type}, registry: {registry_metadata.scale_type}"
+        # The calculator hands back the registry's own entry
+        assert calc_metadata is registry_metadata, \
+            f"{base_name}: Calculator metadata is not the registry entry"
         
         print(f"✓ {base_name}: Calculator metadata matches registry metadata")
     
@@ -10,14 +10,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from datetime import datetime, timedelta
 from shared.strategies.dsl_interpreter.dsl_strategy import create_dsl_strategy_from_file
 from shared.backtest_engine import UniversalBacktestEngine
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+from shared.strategies.dsl_interpreter.debug_log import attach_debug_sink, count_debug_messages
 
 def test_on_candle_processed():
     """Test that on_candle_processed is called during backtest."""
     
-    # Clear debug log
-    with open('/tmp/dsl_debug.log', 'w') as f:
-        f.write("=== Test on_candle_processed ===\n")
+    # Collect diagnostic messages in memory, starting from an empty sink
+    debug_sink = attach_debug_sink()
+    debug_sink.clear()
     
     # Load strategy
     strategy_path = "shared/strategies/dsl_strategies/stochastic_quad_rotation.json"
@@ -27,7 +28,7 @@ def test_on_candle_processed():
     print(f"Is indicator based: {strategy.is_indicator_based}")
     
     # Setup backtest
-    data_connector = DataConnector()
+    data_connector = get_data_connector()
     engine = UniversalBacktestEngine(data_connector)
     
     # Run backtest for just today (2025-12-11)
@@ -53,14 +54,14 @@ def test_on_candle_processed():
     
     # Check debug log
     print(f"\n=== Debug Log Contents ===")
-    with open('/tmp/dsl_debug.log', 'r') as f:
-        log_contents = f.read()
-        print(log_contents)
+    print("\n".join(debug_sink))
     
     # Count how many times on_candle_processed was called
-    wrapper_calls = log_contents.count("WRAPPER on_candle_processed")
-    strategy_calls = log_contents.count("!!! on_candle_processed CALLED")
-    calculate_calls = log_contents.count(">>> _calculate_indicators START")
+    wrapper_calls, strategy_calls, calculate_calls = count_debug_messages(
+        "WRAPPER on_candle_processed",
+        "!!! on_candle_processed CALLED",
+        ">>> _calculate_indicators START"
+    ).values()
     
     print(f"\n=== Call Counts ===")
     print(f"WRAPPER on_candle_processed calls: {wrapper_calls}")
@@ -69,12 +70,17 @@ def test_on_candle_processed():
     
     if wrapper_calls == 0:
         print("\n❌ PROBLEM: Wrapper on_candle_processed is NOT being called!")
+        return False
     elif strategy_calls == 0:
         print("\n❌ PROBLEM: Strategy on_candle_processed is NOT being called!")
+        return False
     elif calculate_calls == 0:
         print("\n❌ PROBLEM: _calculate_indicators is NOT being called!")
+        return False
     else:
         print("\n✅ All methods are being called correctly")
+        return True
 
 if __name__ == "__main__":
-    test_on_candle_processed()
+    success = test_on_candle_processed()
+    sys.exit(0 if success else 1)
@@ -7,9 +7,10 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Clear debug log before test
-with open('/tmp/dsl_debug.log', 'w') as f:
-    f.write("=== Test Start ===\n")
+# Collect diagnostic messages in memory, starting from an empty sink
+from shared.strategies.dsl_interpreter.debug_log import attach_debug_sink, count_debug_messages
+debug_sink = attach_debug_sink()
+debug_sink.clear()
 
 # Import and run backtest via MCP tool
 import asyncio
@@ -36,14 +37,14 @@ async def test():
     
     # Check debug log
     print(f"\n=== Debug Log Contents ===")
-    with open('/tmp/dsl_debug.log', 'r') as f:
-        log_contents = f.read()
-        print(log_contents)
+    print("\n".join(debug_sink))
     
     # Count calls
-    wrapper_calls = log_contents.count("WRAPPER on_candle_processed")
-    strategy_calls = log_contents.count("!!! on_candle_processed CALLED")
-    calculate_calls = log_contents.count(">>> _calculate_indicators START")
+    wrapper_calls, strategy_calls, calculate_calls = count_debug_messages(
+        "WRAPPER on_candle_processed",
+        "!!! on_candle_processed CALLED",
+        ">>> _calculate_indicators START"
+    ).values()
     
     print(f"\n=== Call Counts ===")
     print(f"WRAPPER on_candle_processed calls: {wrapper_calls}")
@@ -52,12 +53,17 @@ async def test():
     
     if wrapper_calls == 0:
         print("\n❌ PROBLEM: Wrapper on_candle_processed is NOT being called!")
+        return False
     elif strategy_calls == 0:
         print("\n❌ PROBLEM: Strategy on_candle_processed is NOT being called!")
+        return False
     elif calculate_calls == 0:
         print("\n❌ PROBLEM: _calculate_indicators is NOT being called!")
+        return False
     else:
         print("\n✅ All methods are being called correctly")
+        return True
 
 if __name__ == "__main__":
-    asyncio.run(test())
+    success = asyncio.run(test())
+    sys.exit(0 if success else 1)
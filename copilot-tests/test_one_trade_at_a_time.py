@@ -7,19 +7,59 @@ and prevents overlapping trades when the strategy checks for active positions.
 """
 
 import asyncio
+import heapq
 import sys
 import json
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.backtest_engine import UniversalBacktestEngine
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
 from shared.strategies.dsl_interpreter.dsl_strategy import DSLStrategy
 from shared.strategy_interface import BacktestConfiguration
 
 
+def find_overlapping_trades(trades):
+    """
+    Find every pair of trades whose holding periods overlap.
+    
+    Sweeps the trades in entry order, keeping the still-open ones in a heap
+    keyed by exit time, so only genuinely concurrent trades are compared
+    (O(N log N) plus the number of overlaps). A trade without an exit time
+    is treated as still open.
+    
+    Returns:
+        Sorted list of (trade_no1, trade_no2, entry1, exit1, entry2, exit2)
+        tuples with 1-based trade numbers, trade_no1 < trade_no2.
+    """
+    intervals = sorted(
+        (datetime.fromisoformat(trade['entry_time']),
+         datetime.fromisoformat(trade['exit_time']) if trade['exit_time'] else datetime.max,
+         idx)
+        for idx, trade in enumerate(trades)
+    )
+    
+    overlaps = []
+    open_trades = []  # heap of (exit, entry, idx)
+    for entry, exit, idx in intervals:
+        # Trades that closed by this entry can't overlap it or anything later
+        while open_trades and open_trades[0][0] <= entry:
+            heapq.heappop(open_trades)
+        for other_exit, other_entry, other_idx in open_trades:
+            if other_entry < exit and entry < other_exit:
+                i, j = sorted((idx, other_idx))
+                overlaps.append((i + 1, j + 1,
+                                 trades[i]['entry_time'], trades[i]['exit_time'],
+                                 trades[j]['entry_time'], trades[j]['exit_time']))
+        heapq.heappush(open_trades, (exit, entry, idx))
+    
+    overlaps.sort()
+    return overlaps
+
+
 async def test_one_trade_at_a_time():
     """Test that only one trade is active at a time."""
     
@@ -46,7 +86,7 @@ async def test_one_trade_at_a_time():
     )
     
     # Create data connector and backtest engine
-    data_connector = DataConnector()
+    data_connector = get_data_connector()
     engine = UniversalBacktestEngine(data_connector)
     
     # Run backtest
@@ -72,21 +112,7 @@ async def test_one_trade_at_a_time():
     print("CHECKING FOR OVERLAPPING TRADES")
     print("=" * 80)
     
-    overlaps = []
-    for i, trade1 in enumerate(trades):
-        entry1 = trade1['entry_time']
-        exit1 = trade1['exit_time']
-        
-        for j, trade2 in enumerate(trades):
-            if i >= j:
-                continue
-            
-            entry2 = trade2['entry_time']
-            exit2 = trade2['exit_time']
-            
-            # Check if trades overlap
-            if entry2 < exit1 and entry1 < exit2:
-                overlaps.append((i+1, j+1, entry1, exit1, entry2, exit2))
+    overlaps = find_overlapping_trades(trades)
     
     if overlaps:
         print(f"\n❌ FOUND {len(overlaps)} OVERLAPPING TRADES:")
@@ -121,10 +147,13 @@ async def test_one_trade_at_a_time():
     if overlaps:
         print("\n❌ TEST FAILED: Trades are still overlapping")
         print("The backtest engine is not properly tracking active trades.")
+        return False
     else:
         print("\n✅ TEST PASSED: One trade at a time rule is working!")
         print("The backtest engine correctly prevents overlapping positions.")
+        return True
 
 
 if __name__ == "__main__":
-    asyncio.run(test_one_trade_at_a_time())
+    success = asyncio.run(test_one_trade_at_a_time())
+    sys.exit(0 if success else 1)
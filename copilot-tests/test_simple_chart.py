@@ -2,15 +2,47 @@
 """Test script to create a simple price chart"""
 
 import asyncio
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import plotly.graph_objects as go
 
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+
+
+def _write_chart(timestamps, opens, highs, lows, closes, symbol, timeframe, days_back, chart_path):
+    """
+    Build the candlestick chart and write it to chart_path.
+
+    Runs in a worker process: it only receives plain lists (ISO timestamp
+    strings and floats), and plotly is imported here so the parent never
+    pays for it.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Candlestick(
+        x=timestamps,
+        open=opens,
+        high=highs,
+        low=lows,
+        close=closes,
+        name=symbol
+    )])
+    
+    fig.update_layout(
+        title=f"{symbol} {timeframe} - Last {days_back} Days",
+        xaxis_title="Time",
+        yaxis_title="Price",
+        template="plotly_white",
+        height=600,
+        xaxis_rangeslider_visible=False
+    )
+    
+    fig.write_html(chart_path)
 
 async def main():
     # Initialize connector
-    connector = DataConnector()
+    connector = get_data_connector()
     
     # Fetch data
     symbol = "EURUSD"
@@ -31,25 +63,9 @@ async def main():
     candles = response.data
     print(f"Fetched {len(candles)} candles from {response.source}")
     
-    # Create simple candlestick chart
-    fig = go.Figure(data=[go.Candlestick(
-        x=[c.timestamp for c in candles],
-        open=[c.open for c in candles],
-        high=[c.high for c in candles],
-        low=[c.low for c in candles],
-        close=[c.close for c in candles],
-        name=symbol
-    )])
-    
-    # Update layout
-    fig.update_layout(
-        title=f"{symbol} {timeframe} - Last {days_back} Days",
-        xaxis_title="Time",
-        yaxis_title="Price",
-        template="plotly_white",
-        height=600,
-        xaxis_rangeslider_visible=False
-    )
+    if not candles:
+        print(f"❌ No candles returned for {symbol} {timeframe}")
+        return False
     
     # Save chart
     charts_dir = Path("data/charts")
@@ -59,7 +75,20 @@ async def main():
     filename = f"{symbol}_{timeframe}_{timestamp}.html"
     chart_path = charts_dir / filename
     
-    fig.write_html(str(chart_path))
+    # Serialize and write the chart in a background process
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        write_future = loop.run_in_executor(
+            pool, _write_chart,
+            [c.timestamp.isoformat() for c in candles],
+            [c.open for c in candles],
+            [c.high for c in candles],
+            [c.low for c in candles],
+            [c.close for c in candles],
+            symbol, timeframe, days_back, str(chart_path)
+        )
+        print(f"Writing chart in background: {chart_path}")
+        await write_future
     
     print(f"\n✅ Chart created: {chart_path}")
     print(f"📊 Contains {len(candles)} candlesticks")
@@ -67,6 +96,8 @@ async def main():
     # Open the chart
     import os
     os.system(f'open "{chart_path}"')
+    return True
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Check the shared stochastic kernels against the pandas rolling formulation
+used by StochasticCalculator.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared._stoch_jit import (
+    _sma_valid, _stoch_k_loop, _stoch_k_numpy, _stoch_kd_loop, _stoch_kd_numpy
+)
+
+CONFIGS = [(9, 1, 3), (14, 1, 3), (40, 1, 4), (60, 1, 10), (14, 3, 3), (5, 2, 4)]
+
+
+def make_prices(count: int = 2000, seed: int = 7):
+    """Random-walk OHLC with a flat stretch to exercise the zero-range case."""
+    rng = np.random.default_rng(seed)
+    closes = 6800 + np.cumsum(rng.normal(scale=2.0, size=count)).round(1)
+    highs = closes + rng.random(count).round(1)
+    lows = closes - rng.random(count).round(1)
+    highs[100:130] = lows[100:130] = closes[100:130] = closes[100]
+    return highs, lows, closes
+
+
+def pandas_stoch(highs, lows, closes, k_period, k_smoothing, d_smoothing):
+    df = pd.DataFrame({'high': highs, 'low': lows, 'close': closes})
+    lowest_low = df['low'].rolling(window=k_period).min()
+    highest_high = df['high'].rolling(window=k_period).max()
+    price_range = (highest_high - lowest_low).replace(0, 1e-10)
+    k = (df['close'] - lowest_low) / price_range * 100
+    if k_smoothing > 1:
+        k = k.rolling(window=k_smoothing).mean()
+    d = k.rolling(window=d_smoothing).mean()
+    return k.to_numpy(), d.to_numpy()
+
+
+def test_sma_matches_pandas():
+    values = np.random.default_rng(1).normal(size=1000)
+    for window in (2, 3, 10, 60):
+        expected = pd.Series(values).rolling(window=window).mean().to_numpy()[window - 1:]
+        assert np.allclose(_sma_valid(values, window), expected, rtol=0, atol=1e-12), window
+
+
+def test_kernels_match_pandas():
+    highs, lows, closes = make_prices()
+    for config in CONFIGS:
+        expected_k, expected_d = pandas_stoch(highs, lows, closes, *config)
+        for kernel in (_stoch_kd_loop, _stoch_kd_numpy):
+            k, d = kernel(highs, lows, closes, *config)
+            assert np.allclose(k, expected_k, rtol=0, atol=1e-9, equal_nan=True), (kernel.__name__, config)
+            assert np.allclose(d, expected_d, rtol=0, atol=1e-9, equal_nan=True), (kernel.__name__, config)
+
+
+def test_raw_k_kernels_match_pandas():
+    highs, lows, closes = make_prices()
+    for period in (5, 9, 14, 40):
+        expected_std, _ = pandas_stoch(highs, lows, closes, period, 1, 1)
+        highest_high = pd.Series(highs).rolling(window=period).max().to_numpy()
+        lowest_low = pd.Series(lows).rolling(window=period).min().to_numpy()
+        price_range = highest_high - lowest_low
+        price_range[price_range == 0] = 1e-10
+        expected_inv = (highest_high - closes) / price_range * 100
+        for kernel in (_stoch_k_loop, _stoch_k_numpy):
+            k_std, k_inv = kernel(lows, highs, closes, period)
+            assert np.allclose(k_std, expected_std, rtol=0, atol=1e-9, equal_nan=True), (kernel.__name__, period)
+            assert np.allclose(k_inv, expected_inv, rtol=0, atol=1e-9, equal_nan=True), (kernel.__name__, period)
+
+
+if __name__ == '__main__':
+    test_sma_matches_pandas()
+    test_kernels_match_pandas()
+    test_raw_k_kernels_match_pandas()
+    print("✅ Stochastic kernels match pandas")
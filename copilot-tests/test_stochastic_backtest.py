@@ -14,8 +14,9 @@ sys.path.insert(0, str(project_root))
 
 from shared.strategy_registry import get_strategy_registry
 from shared.models import Candle
-from shared.strategy_interface import StrategyContext
+from shared.strategy_interface import CandleHistoryView, StrategyContext
 from datetime import datetime, timedelta
+import numpy as np
 
 def test_strategy_structure():
     """Test that the strategy has the correct structure."""
@@ -62,23 +63,12 @@ def test_strategy_structure():
         
         # Create sample candles
         base_time = datetime(2025, 1, 1, 9, 0)
-        candles = []
-        
-        for i in range(100):
-            # Create oscillating prices
-            close = 1.0800 + 0.0100 * (0.5 + 0.5 * (i % 20) / 20)
-            high = close + 0.0010
-            low = close - 0.0010
-            
-            candle = Candle(
-                timestamp=base_time + timedelta(minutes=i),
-                open=close,
-                high=high,
-                low=low,
-                close=close,
-                volume=1000
-            )
-            candles.append(candle)
+        # Create oscillating prices
+        i = np.arange(100)
+        closes = 1.0800 + 0.0100 * (0.5 + 0.5 * (i % 20) / 20)
+        timestamps = [base_time + timedelta(minutes=k) for k in range(100)]
+        candles = Candle.from_arrays(timestamps, closes, closes + 0.0010, closes - 0.0010,
+                                     closes, np.full(100, 1000.0))
         
         print(f"Created {len(candles)} sample candles")
         
@@ -90,7 +80,7 @@ def test_strategy_structure():
                 symbol="EURUSD_SB",
                 timeframe="1m",
                 current_position=None,
-                historical_candles=candles[:i+1],  # All candles up to current
+                historical_candles=CandleHistoryView(candles, i + 1),  # All candles up to current, no copy
                 indicators={}  # Empty for now
             )
             
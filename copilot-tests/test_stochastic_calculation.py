@@ -8,16 +8,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
+import numpy as np
 import pandas as pd
 import ta
 from datetime import datetime
-from shared.data_connector import DataConnector
+from shared.data_connector import get_data_connector
+from shared._stoch_jit import stoch_kd
 
 async def test_stochastic_at_1028():
     """Fetch data and calculate stochastic at 10:28."""
     
     # Fetch 1m data for today
-    connector = DataConnector()
+    connector = get_data_connector()
     
     response = await connector.get_market_data(
         symbol="US500_SB",
@@ -38,21 +40,23 @@ async def test_stochastic_at_1028():
         'volume': c.volume
     } for c in response.data])
     
-    # Sort by timestamp
-    df = df.sort_values('timestamp')
+    # Sort by timestamp (positional index, so labels and array offsets agree)
+    df = df.sort_values('timestamp', ignore_index=True)
     
-    # Find 10:28 candle
+    # Find 10:28 candle by binary search on the sorted timestamps
+    timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
     target_time = datetime(2025, 12, 11, 10, 28)
-    target_idx = df[df['timestamp'] == target_time].index
+    target = np.datetime64(target_time, 'ns')
+    target_idx = int(np.searchsorted(timestamps, target))
     
-    if len(target_idx) == 0:
+    if target_idx == len(timestamps) or timestamps[target_idx] != target:
         print(f"❌ No candle found at {target_time}")
         print(f"Available times around 10:28:")
-        mask = (df['timestamp'] >= datetime(2025, 12, 11, 10, 25)) & (df['timestamp'] <= datetime(2025, 12, 11, 10, 30))
-        print(df[mask][['timestamp', 'close']])
-        return
+        window_start = np.searchsorted(timestamps, np.datetime64(datetime(2025, 12, 11, 10, 25), 'ns'), side='left')
+        window_end = np.searchsorted(timestamps, np.datetime64(datetime(2025, 12, 11, 10, 30), 'ns'), side='right')
+        print(df.iloc[window_start:window_end][['timestamp', 'close']])
+        return False
     
-    target_idx = target_idx[0]
     print(f"\n✅ Found candle at 10:28, index={target_idx}")
     print(f"Close: {df.loc[target_idx, 'close']:.2f}")
     
@@ -66,6 +70,11 @@ async def test_stochastic_at_1028():
     
     print(f"\n=== Stochastic Values at 10:28 ===")
     
+    # Load the price columns once; every config reuses the same arrays
+    highs = df['high'].to_numpy(dtype=np.float64)
+    lows = df['low'].to_numpy(dtype=np.float64)
+    closes = df['close'].to_numpy(dtype=np.float64)
+    
     for config in stoch_configs:
         name = config['name']
         k_period = config['k_period']
@@ -73,31 +82,18 @@ async def test_stochastic_at_1028():
         d_smoothing = config['d_smoothing']
         
         # Calculate stochastic
-        df_calc = df.copy()
-        df_calc['lowest_low'] = df_calc['low'].rolling(window=k_period).min()
-        df_calc['highest_high'] = df_calc['high'].rolling(window=k_period).max()
-        df_calc['range'] = df_calc['highest_high'] - df_calc['lowest_low']
-        df_calc['range'] = df_calc['range'].replace(0, 1e-10)
-        df_calc['k_raw'] = ((df_calc['close'] - df_calc['lowest_low']) / df_calc['range']) * 100
-        
-        # Apply %K smoothing
-        if k_smoothing > 1:
-            df_calc['k'] = df_calc['k_raw'].rolling(window=k_smoothing).mean()
-        else:
-            df_calc['k'] = df_calc['k_raw']
-        
-        # Calculate %D
-        df_calc['d'] = df_calc['k'].rolling(window=d_smoothing).mean()
+        k_line, d_line = stoch_kd(highs, lows, closes, k_period, k_smoothing, d_smoothing)
         
-        k_value = df_calc.loc[target_idx, 'k']
-        d_value = df_calc.loc[target_idx, 'd']
+        k_value = k_line[target_idx]
+        d_value = d_line[target_idx]
         
         print(f"{name:12} ({k_period:2},{k_smoothing},{d_smoothing:2}): %K={k_value:6.2f}  %D={d_value:6.2f}")
         
         # Show the range used for calculation
-        lowest = df_calc.loc[target_idx, 'lowest_low']
-        highest = df_calc.loc[target_idx, 'highest_high']
-        close = df_calc.loc[target_idx, 'close']
+        window = slice(max(target_idx - k_period + 1, 0), target_idx + 1)
+        lowest = lows[window].min()
+        highest = highs[window].max()
+        close = closes[target_idx]
         print(f"             Range: Low={lowest:.2f}, High={highest:.2f}, Close={close:.2f}")
     
     print(f"\n=== TradingView Values (from screenshot) ===")
@@ -110,6 +106,8 @@ async def test_stochastic_at_1028():
     start_idx = max(0, target_idx - 5)
     end_idx = min(len(df), target_idx + 6)
     print(df.iloc[start_idx:end_idx][['timestamp', 'open', 'high', 'low', 'close']])
+    return True
 
 if __name__ == "__main__":
-    asyncio.run(test_stochastic_at_1028())
+    success = asyncio.run(test_stochastic_at_1028())
+    sys.exit(0 if success else 1)
@@ -14,37 +14,22 @@ sys.path.insert(0, str(project_root))
 from shared.strategies.dsl_interpreter.dsl_loader import DSLLoader
 from shared.models import Candle
 from datetime import datetime, timedelta
-import random
+import numpy as np
 
-def create_test_candles(count=100):
-    """Create test candles with realistic OHLCV data."""
-    candles = []
-    base_price = 1.1000
-    timestamp = datetime(2025, 1, 1, 9, 0)
-    
-    for i in range(count):
-        # Random walk
-        change = random.uniform(-0.0010, 0.0010)
-        base_price += change
-        
-        open_price = base_price
-        high_price = base_price + random.uniform(0, 0.0005)
-        low_price = base_price - random.uniform(0, 0.0005)
-        close_price = base_price + random.uniform(-0.0003, 0.0003)
-        volume = random.uniform(1000, 5000)
-        
-        candle = Candle(
-            timestamp=timestamp,
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=volume
-        )
-        candles.append(candle)
-        timestamp += timedelta(minutes=15)
-    
-    return candles
+def create_test_candles(count=100, seed=42):
+    """Create test candles with realistic OHLCV data (seeded random walk)."""
+    rng = np.random.default_rng(seed)
+    # One draw per column: walk step, upper/lower wick, close offset, volume
+    steps, wick_high, wick_low, close_noise, volumes = rng.uniform(
+        [-0.0010, 0, 0, -0.0003, 1000],
+        [0.0010, 0.0005, 0.0005, 0.0003, 5000],
+        size=(count, 5)
+    ).T
+    base = 1.1000 + steps.cumsum()
+    timestamps = [datetime(2025, 1, 1, 9, 0) + timedelta(minutes=15 * i) for i in range(count)]
+    
+    return Candle.from_arrays(timestamps, base, base + wick_high, base - wick_low,
+                              base + close_noise, volumes)
 
 def test_metadata_registration():
     """Test that stochastic metadata is properly registered."""
@@ -76,12 +61,11 @@ def test_metadata_registration():
         'slow', 'slow_d'
     ]
     
-    for expected in expected_indicators:
-        if expected in indicator_series:
-            print(f"✓ Found {expected}")
-        else:
-            print(f"✗ Missing {expected}")
-            return False
+    missing = frozenset(expected_indicators) - indicator_series.keys()
+    if missing:
+        print(f"✗ Missing {[name for name in expected_indicators if name in missing]}")
+        return False
+    print(f"✓ Found {expected_indicators}")
     
     # Verify metadata was registered
     from shared.indicators_metadata import metadata_registry
@@ -8,6 +8,7 @@ Verify that get_indicator_series() returns stochastic data for charting.
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -32,22 +33,11 @@ def test_stochastic_charting():
         # Create sample candles
         print("\n2. Creating sample candles...")
         base_time = datetime(2025, 1, 1, 9, 0)
-        candles = []
-        
-        for i in range(100):
-            close = 1.0800 + 0.0100 * (0.5 + 0.5 * (i % 20) / 20)
-            high = close + 0.0010
-            low = close - 0.0010
-            
-            candle = Candle(
-                timestamp=base_time + timedelta(minutes=i),
-                open=close,
-                high=high,
-                low=low,
-                close=close,
-                volume=1000
-            )
-            candles.append(candle)
+        i = np.arange(100)
+        closes = 1.0800 + 0.0100 * (0.5 + 0.5 * (i % 20) / 20)
+        timestamps = [base_time + timedelta(minutes=k) for k in range(100)]
+        candles = Candle.from_arrays(timestamps, closes, closes + 0.0010, closes - 0.0010,
+                                     closes, np.full(100, 1000.0))
         
         print(f"✅ Created {len(candles)} candles")
         
@@ -76,11 +66,13 @@ def test_stochastic_charting():
                 
                 # Check a few values
                 if series:
-                    sample_values = series[-5:]  # Last 5 values
-                    print(f"      Sample values: {[f'{v:.2f}' for v in sample_values]}")
+                    values = np.fromiter((np.nan if v is None else v for v in series),
+                                         dtype=np.float64, count=len(series))
+                    sample = np.array2string(values[-5:], precision=2, floatmode='fixed', separator=', ')
+                    print(f"      Sample values: {sample}")  # Last 5 values
                     
-                    # Verify values are in 0-100 range
-                    if all(0 <= v <= 100 for v in series if v is not None):
+                    # Verify values are in 0-100 range (None/NaN gaps are allowed)
+                    if (np.isnan(values) | ((values >= 0) & (values <= 100))).all():
                         print(f"      ✓ All values in 0-100 range")
                     else:
                         print(f"      ✗ Some values out of range!")
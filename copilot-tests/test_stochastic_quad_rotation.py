@@ -12,6 +12,8 @@ This test verifies:
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -122,12 +124,20 @@ def test_stochastic_calculation():
             (60, 1, 10, "slow")
         ]
         
+        # Extract the price columns once; every config reuses the same arrays
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
+        closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
+        
         for k_period, k_smoothing, d_smoothing, name in configs:
             calc = StochasticCalculator(k_period, k_smoothing, d_smoothing)
-            results = calc.calculate(candles)
+            k_line, d_line = calc.calculate_arrays(highs, lows, closes)
+            
+            # Bars where both %K and %D are defined, as calculate() returns
+            results = k_line[~np.isnan(d_line)]
             
-            if results:
-                last_value = list(results.values())[-1]
+            if results.size:
+                last_value = results[-1]
                 print(f"✅ {name} ({k_period}-{k_smoothing}-{d_smoothing}): {len(results)} values, last = {last_value:.2f}")
                 
                 # Verify value is in 0-100 range
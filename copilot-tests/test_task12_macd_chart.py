@@ -16,7 +16,6 @@ Requirements: 1.1, 5.1, 5.2, 5.3, 5.4
 import sys
 import os
 from datetime import datetime, timedelta
-import re
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +25,70 @@ from shared.chart_engine import ChartEngine
 from shared.data_connector import DataConnector
 
 
+def match_in_order(text, tokens, matched=0):
+    """
+    Advance through tokens that must occur in order (like 'a.*b.*c' with DOTALL).
+
+    Starts from the number already matched and returns the new count, so the
+    match can be resumed on the next line; the tokens never contain newlines.
+    """
+    position = 0
+    while matched < len(tokens):
+        position = text.find(tokens[matched], position)
+        if position < 0:
+            break
+        position += len(tokens[matched])
+        matched += 1
+    return matched
+
+
+def scan_chart_html(chart_path):
+    """
+    Run the chart requirement checks over the HTML file line by line.
+
+    Only one line is held at a time and reading stops as soon as every
+    check has passed. Matching is case-insensitive.
+    """
+    results = {
+        "macd_separate_subplot": False,
+        "macd_line_blue": False,
+        "signal_line_red": False,
+        "histogram_bars": False,
+        "zero_line_present": False,
+        "price_chart_present": False
+    }
+    needles = {'macd', '#2196f3', 'signal', '#ff5722', 'candlestick', 'ohlc'}
+    found = set()
+    histogram_then_bar = bar_then_histogram = 0
+    
+    with open(chart_path, 'r') as f:
+        for line in f:
+            line = line.lower()
+            found.update(needle for needle in needles - found if needle in line)
+            
+            # Single-line checks
+            if not results["macd_separate_subplot"]:
+                results["macd_separate_subplot"] = match_in_order(line, ('subplot', 'macd')) == 2
+            if not results["zero_line_present"]:
+                results["zero_line_present"] = (match_in_order(line, ('hline', 'y', '0')) == 3
+                                                or match_in_order(line, ('y', '0', 'hline')) == 3)
+            
+            # Histogram check spans lines
+            histogram_then_bar = match_in_order(line, ('histogram', 'type', 'bar'), histogram_then_bar)
+            bar_then_histogram = match_in_order(line, ('bar', 'histogram'), bar_then_histogram)
+            results["histogram_bars"] = histogram_then_bar == 3 or bar_then_histogram == 2
+            
+            # Containment checks: both strings anywhere, in either order
+            results["macd_line_blue"] = {'macd', '#2196f3'} <= found
+            results["signal_line_red"] = {'signal', '#ff5722'} <= found
+            results["price_chart_present"] = bool(found & {'candlestick', 'ohlc'})
+            
+            if all(results.values()):
+                break
+    
+    return results
+
+
 def run_macd_backtest():
     """Run MACD Crossover strategy backtest on EURUSD."""
     print("=" * 80)
@@ -96,56 +159,40 @@ def run_macd_backtest():
     # Verify chart contents
     print(f"\n5. Verifying chart requirements...")
     
-    with open(chart_path, 'r') as f:
-        html_content = f.read()
-    
-    verification_results = {
-        "macd_separate_subplot": False,
-        "macd_line_blue": False,
-        "signal_line_red": False,
-        "histogram_bars": False,
-        "zero_line_present": False,
-        "price_chart_present": False
-    }
+    verification_results = scan_chart_html(chart_path)
     
     # Check for MACD in separate subplot (should have subplot title with "MACD")
-    if re.search(r'subplot.*MACD', html_content, re.IGNORECASE):
-        verification_results["macd_separate_subplot"] = True
+    if verification_results["macd_separate_subplot"]:
         print("   ✓ MACD appears in separate subplot")
     else:
         print("   ❌ MACD not found in separate subplot")
     
     # Check for MACD line in blue (#2196F3 or similar blue)
-    if re.search(r'MACD.*#2196F3|#2196F3.*MACD', html_content, re.IGNORECASE | re.DOTALL):
-        verification_results["macd_line_blue"] = True
+    if verification_results["macd_line_blue"]:
         print("   ✓ MACD line is blue")
     else:
         print("   ❌ MACD line color not verified as blue")
     
     # Check for Signal line in red (#FF5722 or similar red)
-    if re.search(r'Signal.*#FF5722|#FF5722.*Signal', html_content, re.IGNORECASE | re.DOTALL):
-        verification_results["signal_line_red"] = True
+    if verification_results["signal_line_red"]:
         print("   ✓ Signal line is red")
     else:
         print("   ❌ Signal line color not verified as red")
     
     # Check for histogram as bars (Bar trace type)
-    if re.search(r'Histogram.*type.*bar|bar.*Histogram', html_content, re.IGNORECASE | re.DOTALL):
-        verification_results["histogram_bars"] = True
+    if verification_results["histogram_bars"]:
         print("   ✓ Histogram rendered as bars")
     else:
         print("   ❌ Histogram not verified as bars")
     
     # Check for zero line (horizontal line at y=0)
-    if re.search(r'hline.*y.*0|y.*0.*hline', html_content, re.IGNORECASE):
-        verification_results["zero_line_present"] = True
+    if verification_results["zero_line_present"]:
         print("   ✓ Zero line present")
     else:
         print("   ❌ Zero line not found")
     
     # Check for price chart (candlestick)
-    if 'candlestick' in html_content.lower() or 'ohlc' in html_content.lower():
-        verification_results["price_chart_present"] = True
+    if verification_results["price_chart_present"]:
         print("   ✓ Price chart present and unaffected")
     else:
         print("   ❌ Price chart not verified")
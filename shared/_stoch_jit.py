@@ -0,0 +1,218 @@
+"""
+Stochastic %K/%D over raw price arrays.
+
+Compiled with numba when available: a single fused pass keeps the rolling
+highest high / lowest low in monotonic index deques and the %K/%D SMAs as
+running sums over small ring buffers, so each bar is O(1) amortized and
+only the two output lines are allocated. Without numba a vectorized NumPy
+path gives the same output. ``stoch_k`` is the same kernel without the
+smoothing stages, returning the raw %K and its inverted reading.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _stoch_kd_loop(highs, lows, closes, k_period, k_smoothing, d_smoothing):
+    n = len(closes)
+    k_line = np.full(n, np.nan)
+    d_line = np.full(n, np.nan)
+
+    # Rolling max/min index deques and the SMA windows live in small ring
+    # buffers, so only the two output lines are allocated at full length
+    max_ring = np.empty(k_period, dtype=np.int64)
+    min_ring = np.empty(k_period, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+    k_ring = np.empty(k_smoothing)
+    d_ring = np.empty(d_smoothing)
+
+    first_k_raw = k_period - 1
+    first_k = first_k_raw + k_smoothing - 1
+    k_sum = 0.0
+    d_sum = 0.0
+
+    for i in range(n):
+        # Drop the expired front before pushing so a deque never exceeds k_period
+        if max_tail > max_head and max_ring[max_head % k_period] <= i - k_period:
+            max_head += 1
+        while max_tail > max_head and highs[max_ring[(max_tail - 1) % k_period]] <= highs[i]:
+            max_tail -= 1
+        max_ring[max_tail % k_period] = i
+        max_tail += 1
+
+        if min_tail > min_head and min_ring[min_head % k_period] <= i - k_period:
+            min_head += 1
+        while min_tail > min_head and lows[min_ring[(min_tail - 1) % k_period]] >= lows[i]:
+            min_tail -= 1
+        min_ring[min_tail % k_period] = i
+        min_tail += 1
+
+        if i < first_k_raw:
+            continue
+
+        lowest_low = lows[min_ring[min_head % k_period]]
+        price_range = highs[max_ring[max_head % k_period]] - lowest_low
+        if price_range == 0:
+            price_range = 1e-10
+        k_raw = (closes[i] - lowest_low) / price_range * 100
+
+        # %K = SMA(raw %K, k_smoothing)
+        j = i - first_k_raw
+        slot = j % k_smoothing
+        if j >= k_smoothing:
+            k_sum -= k_ring[slot]
+        k_ring[slot] = k_raw
+        k_sum += k_raw
+        if i < first_k:
+            continue
+        k_value = k_sum / k_smoothing
+        k_line[i] = k_value
+
+        # %D = SMA(%K, d_smoothing)
+        j = i - first_k
+        slot = j % d_smoothing
+        if j >= d_smoothing:
+            d_sum -= d_ring[slot]
+        d_ring[slot] = k_value
+        d_sum += k_value
+        if j >= d_smoothing - 1:
+            d_line[i] = d_sum / d_smoothing
+
+    return k_line, d_line
+
+
+def _sma_valid(values, window):
+    """Simple moving average over full windows only, via a cumulative sum (O(n))."""
+    if window <= 1:
+        return values
+    if len(values) < window:
+        return values[:0]
+    cumsum = np.empty(len(values) + 1, dtype=np.float64)
+    cumsum[0] = 0.0
+    np.cumsum(values, out=cumsum[1:])
+    return ((cumsum[window:] - cumsum[:-window]) / window).astype(values.dtype, copy=False)
+
+
+def _stoch_kd_numpy(highs, lows, closes, k_period, k_smoothing, d_smoothing):
+    n = len(closes)
+    k_line = np.full(n, np.nan, dtype=closes.dtype)
+    d_line = np.full(n, np.nan, dtype=closes.dtype)
+    if n < k_period:
+        return k_line, d_line
+
+    # Two (n - k_period + 1)-length scratch arrays, reused in place; the
+    # inputs are only read through views
+    lowest_low = sliding_window_view(lows, k_period).min(axis=1)
+    price_range = sliding_window_view(highs, k_period).max(axis=1)
+    price_range -= lowest_low
+    price_range[price_range == 0] = 1e-10
+    k_raw = np.subtract(closes[k_period - 1:], lowest_low, out=lowest_low)
+    k_raw /= price_range
+    k_raw *= 100
+
+    k = _sma_valid(k_raw, k_smoothing)
+    d = _sma_valid(k, d_smoothing)
+    k_line[n - len(k):n] = k
+    d_line[n - len(d):n] = d
+    return k_line, d_line
+
+
+def _stoch_k_loop(lows, highs, closes, period):
+    n = len(closes)
+    k_std = np.full(n, np.nan)
+    k_inv = np.full(n, np.nan)
+
+    max_ring = np.empty(period, dtype=np.int64)
+    min_ring = np.empty(period, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        if max_tail > max_head and max_ring[max_head % period] <= i - period:
+            max_head += 1
+        while max_tail > max_head and highs[max_ring[(max_tail - 1) % period]] <= highs[i]:
+            max_tail -= 1
+        max_ring[max_tail % period] = i
+        max_tail += 1
+
+        if min_tail > min_head and min_ring[min_head % period] <= i - period:
+            min_head += 1
+        while min_tail > min_head and lows[min_ring[(min_tail - 1) % period]] >= lows[i]:
+            min_tail -= 1
+        min_ring[min_tail % period] = i
+        min_tail += 1
+
+        if i < period - 1:
+            continue
+
+        lowest_low = lows[min_ring[min_head % period]]
+        highest_high = highs[max_ring[max_head % period]]
+        price_range = highest_high - lowest_low
+        if price_range == 0:
+            price_range = 1e-10
+        k_std[i] = (closes[i] - lowest_low) / price_range * 100
+        k_inv[i] = (highest_high - closes[i]) / price_range * 100
+
+    return k_std, k_inv
+
+
+def _stoch_k_numpy(lows, highs, closes, period):
+    n = len(closes)
+    k_std = np.full(n, np.nan)
+    k_inv = np.full(n, np.nan)
+    if n < period:
+        return k_std, k_inv
+
+    lowest_low = sliding_window_view(lows, period).min(axis=1)
+    highest_high = sliding_window_view(highs, period).max(axis=1)
+    price_range = highest_high - lowest_low
+    price_range[price_range == 0] = 1e-10
+    window_closes = closes[period - 1:]
+    k_std[period - 1:] = (window_closes - lowest_low) / price_range * 100
+    k_inv[period - 1:] = (highest_high - window_closes) / price_range * 100
+    return k_std, k_inv
+
+
+if njit is not None:
+    _stoch_kd_impl = njit(cache=True)(_stoch_kd_loop)
+    _stoch_k_impl = njit(cache=True)(_stoch_k_loop)
+else:
+    _stoch_kd_impl = _stoch_kd_numpy
+    _stoch_k_impl = _stoch_k_numpy
+
+
+def stoch_kd(highs, lows, closes, k_period: int = 14, k_smoothing: int = 1, d_smoothing: int = 3):
+    """
+    Calculate the stochastic %K and %D lines.
+
+    Returns two arrays the same length as the inputs, NaN until enough bars
+    are available. float32 inputs are kept as float32 to halve the memory
+    traffic of the window scans (the compiled loop still accumulates in
+    float64); anything else is computed in float64.
+    """
+    dtype = np.float32 if highs.dtype == lows.dtype == closes.dtype == np.float32 else np.float64
+    highs = np.ascontiguousarray(highs, dtype=dtype)
+    lows = np.ascontiguousarray(lows, dtype=dtype)
+    closes = np.ascontiguousarray(closes, dtype=dtype)
+    return _stoch_kd_impl(highs, lows, closes, k_period, k_smoothing, d_smoothing)
+
+
+def stoch_k(lows, highs, closes, period: int):
+    """
+    Calculate the raw (unsmoothed) stochastic %K and its inverse.
+
+    Returns ``(k_std, k_inv)`` where ``k_std`` is the usual
+    ``(close - lowest low) / range`` reading and ``k_inv`` is
+    ``(highest high - close) / range``, both scaled to 0-100, float64 and NaN
+    for the first ``period - 1`` bars.
+    """
+    lows = np.ascontiguousarray(lows, dtype=np.float64)
+    highs = np.ascontiguousarray(highs, dtype=np.float64)
+    closes = np.ascontiguousarray(closes, dtype=np.float64)
+    return _stoch_k_impl(lows, highs, closes, period)
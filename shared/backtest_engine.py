@@ -15,9 +15,16 @@ import logging
 import os
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from shared.models import Candle, Trade, TradeDirection, TradeResult
 from shared.strategy_interface import (
-    TradingStrategy, StrategyContext, BacktestConfiguration, 
+    TradingStrategy, StrategyContext, CandleHistoryView, BacktestConfiguration, 
     BacktestResults, SignalStrength
 )
 from shared.indicators import indicator_registry, IndicatorRegistry
@@ -58,6 +65,27 @@ if not logger.handlers:
     logger.addHandler(console_handler)
 
 
+def _scan_fixed_exit(highs, lows, start, is_buy, stop_loss, take_profit):
+    """
+    Return the index of the first candle from ``start`` that hits a fixed SL or TP, or -1.
+    
+    Mirrors _check_exit_conditions_simple with trailing stops disabled; the
+    caller re-runs that check on the returned candle to build the exit result.
+    """
+    for i in range(start, highs.shape[0]):
+        if is_buy:
+            if lows[i] <= stop_loss or highs[i] >= take_profit:
+                return i
+        else:
+            if highs[i] >= stop_loss or lows[i] <= take_profit:
+                return i
+    return -1
+
+
+# Only worth it when compiled - without numba the candle loop is used directly
+_scan_fixed_exit = njit(cache=True)(_scan_fixed_exit) if njit is not None else None
+
+
 class UniversalBacktestEngine:
     """
     Universal backtesting engine that can run any strategy.
@@ -498,7 +526,7 @@ class UniversalBacktestEngine:
             # Create strategy context
             context = StrategyContext(
                 current_candle=candle,
-                historical_candles=historical_candles.copy(),
+                historical_candles=CandleHistoryView(historical_candles, len(historical_candles)),
                 indicators=current_indicators,
                 current_position=open_trade,
                 symbol=config.symbol,
@@ -631,7 +659,7 @@ class UniversalBacktestEngine:
             # Create strategy context
             context = StrategyContext(
                 current_candle=candle,
-                historical_candles=historical_candles.copy(),
+                historical_candles=CandleHistoryView(historical_candles, len(historical_candles)),
                 indicators=current_indicators,
                 current_position=open_trade,
                 symbol=config.symbol,
@@ -796,7 +824,7 @@ class UniversalBacktestEngine:
             # Create strategy context with current position
             context = StrategyContext(
                 current_candle=candle,
-                historical_candles=historical_candles.copy(),
+                historical_candles=CandleHistoryView(historical_candles, len(historical_candles)),
                 indicators=current_indicators,
                 current_position=current_position,
                 symbol=config.symbol,
@@ -982,7 +1010,23 @@ class UniversalBacktestEngine:
         # CRITICAL: Use previous candle to update trailing stop, current candle to check exit
         previous_candle = entry_candle
         
-        for i, candle in enumerate(execution_candles):
+        exit_candles = execution_candles
+        if not trailing_enabled and _scan_fixed_exit is not None:
+            # Fixed SL/TP: let the compiled kernel find the exit candle, then
+            # run the regular exit check on just that candle
+            start = next(
+                (i for i, c in enumerate(execution_candles) if c.timestamp > entry_candle.timestamp),
+                len(execution_candles)
+            )
+            highs = np.fromiter((c.high for c in execution_candles), dtype=np.float64, count=len(execution_candles))
+            lows = np.fromiter((c.low for c in execution_candles), dtype=np.float64, count=len(execution_candles))
+            hit = _scan_fixed_exit(
+                highs, lows, start, trade.direction == TradeDirection.BUY,
+                trade.stop_loss, trade.take_profit
+            )
+            exit_candles = execution_candles[hit:hit + 1] if hit >= 0 else []
+        
+        for i, candle in enumerate(exit_candles):
             if candle.timestamp > entry_candle.timestamp:
                 # Update trailing stop based on PREVIOUS candle (not current)
                 if trailing_enabled and previous_candle:
@@ -16,6 +16,8 @@ import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import compress
 import json
 import logging
 
@@ -23,6 +25,7 @@ import logging
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.io as pio
+import numpy as np
 import pandas as pd
 
 # Project imports
@@ -33,6 +36,69 @@ from shared.utils import ensure_directory_exists, sanitize_symbol, format_timest
 logger = logging.getLogger(__name__)
 
 
+def candles_to_arrays(candles: List[Candle]) -> Dict[str, np.ndarray]:
+    """Split candles into one array per field (timestamps stay as objects)."""
+    count = len(candles)
+    arrays = {'timestamp': np.array([candle.timestamp for candle in candles], dtype=object)}
+    for field in ('open', 'high', 'low', 'close'):
+        arrays[field] = np.fromiter((getattr(candle, field) for candle in candles), dtype=np.float64, count=count)
+    arrays['volume'] = np.array([candle.volume for candle in candles], dtype=np.float64)
+    return arrays
+
+
+def indicator_to_array(values, length: int) -> np.ndarray:
+    """
+    Indicator values as a float64 array aligned to ``length`` timestamps.
+
+    None becomes NaN, and missing trailing values are padded with NaN, so
+    callers can filter with a single ``np.isnan`` mask and hand the result to
+    Plotly as a packed array instead of a list of Python floats.
+    """
+    array = np.full(length, np.nan)
+    count = min(len(values), length)
+    array[:count] = np.asarray(values[:count], dtype=np.float64)
+    return array
+
+
+@lru_cache(maxsize=64)
+def _oscillator_names(indicator_names: Tuple[str, ...], registry_version: int) -> Tuple[str, ...]:
+    """
+    Pick the indicators that get their own oscillator subplot, in order.
+
+    ``registry_version`` is only part of the cache key, so registering new
+    metadata invalidates earlier results.
+    """
+    from shared.indicators_metadata import metadata_registry
+    
+    oscillators = []
+    for indicator_name in indicator_names:
+        try:
+            # Skip MACD signal and histogram - they're rendered with the main MACD line
+            if indicator_name.endswith('_signal') or indicator_name.endswith('_histogram'):
+                continue
+            
+            # Skip stochastic %D - it's rendered with the %K line
+            if indicator_name.endswith('_d'):
+                continue
+            
+            # Check if oscillator with error handling
+            is_oscillator = False
+            try:
+                is_oscillator = metadata_registry.is_oscillator(indicator_name)
+            except Exception as e:
+                logger.error(f"Error checking if '{indicator_name}' is oscillator: {e}")
+                # Assume not an oscillator if we can't determine
+                is_oscillator = False
+            
+            if is_oscillator:
+                oscillators.append(indicator_name)
+                
+        except Exception as e:
+            logger.error(f"Error processing indicator '{indicator_name}' in layout determination: {e}")
+            continue
+    return tuple(oscillators)
+
+
 class ChartEngine:
     """
     Pure chart engine that visualizes backtest results.
@@ -97,39 +163,17 @@ class ChartEngine:
         oscillator_count = 0
         oscillator_mapping = {}  # Map indicator name to oscillator index
         
-        # Check for oscillators and assign them to subplots
-        # Each oscillator gets its own subplot, even if they're the same type
+        # Each oscillator gets its own subplot, even if they're the same type.
+        # The classification only depends on the indicator names and the
+        # registry contents, so it is cached per (names, registry version).
         if indicators:
-            # Sort for consistent ordering
-            for indicator_name in sorted(indicators.keys()):
-                try:
-                    # Skip MACD signal and histogram - they're rendered with the main MACD line
-                    if indicator_name.endswith('_signal') or indicator_name.endswith('_histogram'):
-                        continue
-                    
-                    # Skip stochastic %D - it's rendered with the %K line
-                    if indicator_name.endswith('_d'):
-                        continue
-                    
-                    # Check if oscillator with error handling
-                    is_oscillator = False
-                    try:
-                        is_oscillator = metadata_registry.is_oscillator(indicator_name)
-                    except Exception as e:
-                        logger.error(f"Error checking if '{indicator_name}' is oscillator: {e}")
-                        # Assume not an oscillator if we can't determine
-                        is_oscillator = False
-                    
-                    if is_oscillator:
-                        oscillator_count += 1
-                        layout[f"oscillator_{oscillator_count}"] = current_row
-                        oscillator_mapping[indicator_name] = oscillator_count
-                        current_row += 1
-                        logger.info(f"Assigned {indicator_name} to oscillator_{oscillator_count} (row {current_row - 1})")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing indicator '{indicator_name}' in layout determination: {e}")
-                    continue
+            oscillators = _oscillator_names(tuple(sorted(indicators.keys())), metadata_registry.version)
+            for indicator_name in oscillators:
+                oscillator_count += 1
+                layout[f"oscillator_{oscillator_count}"] = current_row
+                oscillator_mapping[indicator_name] = oscillator_count
+                current_row += 1
+                logger.info(f"Assigned {indicator_name} to oscillator_{oscillator_count} (row {current_row - 1})")
         
         # Add volume subplot
         layout["volume"] = current_row
@@ -656,18 +700,7 @@ class ChartEngine:
     
     def _candles_to_dataframe(self, candles: List[Candle]) -> pd.DataFrame:
         """Convert list of Candle objects to DataFrame."""
-        data = []
-        for candle in candles:
-            data.append({
-                'timestamp': candle.timestamp,
-                'open': candle.open,
-                'high': candle.high,
-                'low': candle.low,
-                'close': candle.close,
-                'volume': candle.volume
-            })
-        
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(candles_to_arrays(candles))
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         return df.sort_values('timestamp')
     
@@ -1023,71 +1056,57 @@ class ChartEngine:
         histogram_style = metadata.components.get("histogram", ComponentStyle(color="#9E9E9E", label="Histogram", line_type="bar"))
         
         # Filter and add MACD line (blue)
-        filtered_macd = []
-        filtered_signal = []
-        filtered_histogram = []
-        filtered_timestamps = []
-        
-        for i, ts in enumerate(timestamps):
-            macd_val = macd_values[i] if i < len(macd_values) else None
-            signal_val = signal_values[i] if i < len(signal_values) else None
-            histogram_val = histogram_values[i] if i < len(histogram_values) else None
-            
-            # Only include if all three components are valid
-            if (macd_val is not None and not (isinstance(macd_val, float) and macd_val != macd_val) and
-                signal_val is not None and not (isinstance(signal_val, float) and signal_val != signal_val) and
-                histogram_val is not None and not (isinstance(histogram_val, float) and histogram_val != histogram_val)):
-                filtered_macd.append(macd_val)
-                filtered_signal.append(signal_val)
-                filtered_histogram.append(histogram_val)
-                filtered_timestamps.append(ts)
+        count = len(timestamps)
+        macd_array = indicator_to_array(macd_values, count)
+        signal_array = indicator_to_array(signal_values, count)
+        histogram_array = indicator_to_array(histogram_values, count)
+        
+        # Only include bars where all three components are valid
+        valid = ~(np.isnan(macd_array) | np.isnan(signal_array) | np.isnan(histogram_array))
+        filtered_macd = macd_array[valid]
+        filtered_signal = signal_array[valid]
+        filtered_histogram = histogram_array[valid]
+        filtered_timestamps = list(compress(timestamps, valid))
         
         if len(filtered_timestamps) == 0:
             logger.warning(f"No valid MACD values, skipping")
             return
         
-        logger.info(f"Adding MACD line with {len(filtered_macd)} points")
-        # Add MACD line (blue)
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_timestamps,
-                y=filtered_macd,
-                mode='lines',
-                name=macd_style.label,
-                line=dict(color=macd_style.color, width=macd_style.width),
-                hovertemplate=f'{macd_style.label}: %{{y:.5f}}<extra></extra>',
-                showlegend=True
-            ),
-            row=row, col=1
-        )
-        
-        logger.info(f"Adding Signal line with {len(filtered_signal)} points")
-        # Add Signal line (red)
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_timestamps,
-                y=filtered_signal,
-                mode='lines',
-                name=signal_style.label,
-                line=dict(color=signal_style.color, width=signal_style.width),
-                hovertemplate=f'{signal_style.label}: %{{y:.5f}}<extra></extra>',
-                showlegend=True
-            ),
-            row=row, col=1
-        )
-        
-        logger.info(f"Adding Histogram with {len(filtered_histogram)} points")
-        # Add Histogram (gray bars)
-        fig.add_trace(
-            go.Bar(
-                x=filtered_timestamps,
-                y=filtered_histogram,
-                name=histogram_style.label,
-                marker_color=histogram_style.color,
-                showlegend=True,
-                hovertemplate=f'{histogram_style.label}: %{{y:.5f}}<extra></extra>'
-            ),
-            row=row, col=1
+        logger.info(f"Adding MACD line, Signal line and Histogram with {len(filtered_macd)} points")
+        # Add all three components in one call so the figure is updated once
+        fig.add_traces(
+            [
+                # MACD line (blue)
+                go.Scatter(
+                    x=filtered_timestamps,
+                    y=filtered_macd,
+                    mode='lines',
+                    name=macd_style.label,
+                    line=dict(color=macd_style.color, width=macd_style.width),
+                    hovertemplate=f'{macd_style.label}: %{{y:.5f}}<extra></extra>',
+                    showlegend=True
+                ),
+                # Signal line (red)
+                go.Scatter(
+                    x=filtered_timestamps,
+                    y=filtered_signal,
+                    mode='lines',
+                    name=signal_style.label,
+                    line=dict(color=signal_style.color, width=signal_style.width),
+                    hovertemplate=f'{signal_style.label}: %{{y:.5f}}<extra></extra>',
+                    showlegend=True
+                ),
+                # Histogram (gray bars)
+                go.Bar(
+                    x=filtered_timestamps,
+                    y=filtered_histogram,
+                    name=histogram_style.label,
+                    marker_color=histogram_style.color,
+                    showlegend=True,
+                    hovertemplate=f'{histogram_style.label}: %{{y:.5f}}<extra></extra>'
+                ),
+            ],
+            rows=[row] * 3, cols=[1] * 3
         )
         
         logger.info(f"Successfully added all three MACD components")
@@ -1173,20 +1192,15 @@ class ChartEngine:
         d_style = metadata.components.get("d", ComponentStyle(color="#FF9800", label="%D", width=2.0, dash="dash"))
         
         # Filter and align data
-        filtered_k = []
-        filtered_d = []
-        filtered_timestamps = []
+        count = len(timestamps)
+        k_array = indicator_to_array(k_values, count)
+        d_array = indicator_to_array(d_values, count)
         
-        for i, ts in enumerate(timestamps):
-            k_val = k_values[i] if i < len(k_values) else None
-            d_val = d_values[i] if i < len(d_values) else None
-            
-            # Only include if both values are valid
-            if (k_val is not None and not (isinstance(k_val, float) and k_val != k_val) and
-                d_val is not None and not (isinstance(d_val, float) and d_val != d_val)):
-                filtered_k.append(k_val)
-                filtered_d.append(d_val)
-                filtered_timestamps.append(ts)
+        # Only include bars where both values are valid
+        valid = ~(np.isnan(k_array) | np.isnan(d_array))
+        filtered_k = k_array[valid]
+        filtered_d = d_array[valid]
+        filtered_timestamps = list(compress(timestamps, valid))
         
         if len(filtered_timestamps) == 0:
             logger.warning(f"No valid stochastic values for {indicator_name}, skipping")
@@ -1247,13 +1261,10 @@ class ChartEngine:
         from shared.indicators_metadata import ComponentStyle
         
         # Filter out NaN/None values
-        filtered_values = []
-        filtered_timestamps = []
-        
-        for i, value in enumerate(values):
-            if i < len(timestamps) and value is not None and not (isinstance(value, float) and value != value):  # Check for NaN
-                filtered_values.append(value)
-                filtered_timestamps.append(timestamps[i])
+        value_array = indicator_to_array(values, len(timestamps))
+        valid = ~np.isnan(value_array)
+        filtered_values = value_array[valid]
+        filtered_timestamps = list(compress(timestamps, valid))
         
         if len(filtered_values) == 0:
             logger.warning(f"No valid values for {indicator_name}, skipping")
@@ -1316,13 +1327,10 @@ class ChartEngine:
             row: Row number for the subplot
         """
         # Filter out NaN/zero values for cleaner display
-        filtered_values = []
-        filtered_timestamps = []
-        
-        for i, value in enumerate(values):
-            if i < len(timestamps) and value is not None and value > 0:  # Only show non-zero values
-                filtered_values.append(value)
-                filtered_timestamps.append(timestamps[i])
+        value_array = indicator_to_array(values, len(timestamps))
+        valid = value_array > 0  # Only show non-zero values (NaN compares False)
+        filtered_values = value_array[valid]
+        filtered_timestamps = list(compress(timestamps, valid))
         
         if len(filtered_values) == 0:
             logger.warning(f"No valid values for {indicator_name}, skipping")
@@ -1374,35 +1382,52 @@ class ChartEngine:
         # For now, we'll use the simple routing for backward compatibility
         # The full routing will be used when create_comprehensive_chart is updated
         
-        # Track which indicators we've already added (to avoid duplicates for MACD components)
-        added_indicators = set()
+        # For backward compatibility, we need to check if we have a layout
+        # If not, fall back to the old behavior (add to price chart)
+        if hasattr(self, '_current_layout'):
+            self._route_indicators(fig, indicators, df['timestamp'].tolist(), self._current_layout)
+            return
         
         for indicator_name, values in indicators.items():
-            # Skip MACD signal and histogram - they'll be added with the main MACD line
-            if indicator_name.endswith('_signal') or indicator_name.endswith('_histogram'):
-                base_name = indicator_name.replace('_signal', '').replace('_histogram', '')
-                if base_name in indicators or 'macd' in base_name.lower():
-                    logger.info(f"Skipping {indicator_name} - will be rendered with MACD line")
-                    continue
-            
-            # Skip if already added
-            if indicator_name in added_indicators:
+            if self._is_macd_companion(indicator_name, indicators):
+                logger.info(f"Skipping {indicator_name} - will be rendered with MACD line")
                 continue
             
-            # Use the new routing logic
-            timestamps = df['timestamp'].tolist()
-            
-            # For backward compatibility, we need to check if we have a layout
-            # If not, fall back to the old behavior (add to price chart)
-            if hasattr(self, '_current_layout'):
-                self._route_indicator_to_subplot(
-                    fig, indicator_name, values, timestamps, self._current_layout
-                )
-            else:
-                # Fallback: old behavior for backward compatibility
-                self._add_indicator_to_price_chart(fig, df, indicator_name, values, row)
-            
-            added_indicators.add(indicator_name)
+            # Fallback: old behavior for backward compatibility
+            self._add_indicator_to_price_chart(fig, df, indicator_name, values, row)
+    
+    @staticmethod
+    def _is_macd_companion(indicator_name: str, indicators: Dict[str, List[float]]) -> bool:
+        """Whether this is a MACD signal/histogram series drawn with its MACD line."""
+        if indicator_name.endswith('_signal') or indicator_name.endswith('_histogram'):
+            base_name = indicator_name.replace('_signal', '').replace('_histogram', '')
+            return base_name in indicators or 'macd' in base_name.lower()
+        return False
+    
+    def _route_indicators(
+        self,
+        fig,
+        indicators: Dict[str, List[float]],
+        timestamps: List,
+        layout: Dict[str, int]
+    ):
+        """
+        Route every indicator in ``indicators`` to its subplot.
+        
+        MACD signal/histogram series are skipped since they're rendered with
+        the main MACD line. All indicators share the one ``timestamps`` list.
+        
+        Args:
+            fig: Plotly figure object
+            indicators: Dictionary of indicator names to their values
+            timestamps: List of timestamps corresponding to values
+            layout: Subplot layout mapping from _determine_subplot_layout()
+        """
+        for indicator_name, values in indicators.items():
+            if self._is_macd_companion(indicator_name, indicators):
+                logger.info(f"Skipping {indicator_name} - will be rendered with MACD line")
+                continue
+            self._route_indicator_to_subplot(fig, indicator_name, values, timestamps, layout)
     
     def _add_indicator_to_price_chart(self, fig, df: pd.DataFrame, indicator_name: str, values: List[float], row: int):
         """
@@ -8,11 +8,14 @@ NO NEW ABSTRACTIONS - uses proven working code.
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import asyncio
+import hashlib
 import logging
+import pickle
 import sys
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from .models import Candle
 
 # Import the working data fetching function
@@ -28,6 +31,16 @@ spec.loader.exec_module(influxdb_module)
 VPS_TICK_ENABLED = os.environ.get("VPS_TICK_ENABLED", "true").lower() == "true"
 VPS_TICK_URL = os.environ.get("VPS_TICK_URL", "http://localhost:8020")
 
+# Number of successful get_market_data responses kept in memory per connector
+MARKET_DATA_CACHE_SIZE = int(os.environ.get("MARKET_DATA_CACHE_SIZE", "512"))
+
+# On-disk market data cache, shared across runs and worker processes.
+# Only ranges that ended before today are written, so live days are always refetched.
+MARKET_DATA_DISK_CACHE_ENABLED = os.environ.get("MARKET_DATA_DISK_CACHE_ENABLED", "true").lower() == "true"
+MARKET_DATA_CACHE_DIR = Path(os.environ.get(
+    "MARKET_DATA_CACHE_DIR", str(Path(__file__).parent.parent / "data" / "cache")
+))
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +63,7 @@ class DataConnector:
     
     def __init__(self):
         """Initialize the data connector."""
-        pass
+        self._market_data_cache: "OrderedDict[tuple, MarketDataResponse]" = OrderedDict()
     
     async def get_market_data(
         self,
@@ -59,13 +72,126 @@ class DataConnector:
         start_date: datetime,
         end_date: datetime,
         use_tick_data: bool = False,
+        use_cache: bool = True,
         **kwargs
     ) -> MarketDataResponse:
         """
         Get market data using the existing working _fetch_historical_data function.
         
         This method provides the interface expected by UniversalBacktestEngine.
+        Successful responses for completed past days are cached per
+        (symbol, timeframe, start, end, tick mode): in memory for this
+        connector and on disk, so repeated backtests over the same range don't
+        re-download candles. Ranges ending today or later are always fetched,
+        since their candles are still changing. Pass use_cache=False to always
+        hit the API; calls with extra fetch kwargs also bypass the cache.
         """
+        # Extra kwargs change the fetch but aren't part of the key
+        use_cache = use_cache and not kwargs
+        
+        cache_key = (
+            symbol,
+            timeframe,
+            start_date.isoformat() if isinstance(start_date, datetime) else str(start_date),
+            end_date.isoformat() if isinstance(end_date, datetime) else str(end_date),
+            use_tick_data
+        )
+        
+        if use_cache:
+            cached = self._market_data_cache.get(cache_key)
+            if cached is not None:
+                self._market_data_cache.move_to_end(cache_key)
+                logger.info(f"📦 get_market_data cache hit: {symbol} {timeframe} from {start_date} to {end_date}")
+                # Hand out a fresh list so callers can't mutate the cached candles
+                return replace(cached, data=list(cached.data))
+            
+            cached = self._load_disk_cache(cache_key)
+            if cached is not None:
+                logger.info(f"💾 get_market_data disk cache hit: {symbol} {timeframe} from {start_date} to {end_date}")
+                self._remember(cache_key, cached)
+                return replace(cached, data=list(cached.data))
+        
+        response = await self._fetch_market_data(
+            symbol, timeframe, start_date, end_date, use_tick_data, **kwargs
+        )
+        
+        # Only cache successful fetches of completed ranges, so transient
+        # failures are retried and live ranges pick up new candles
+        if use_cache and response.data and self._is_completed_range(end_date):
+            self._remember(cache_key, response)
+            self._save_disk_cache(cache_key, response)
+        
+        return response
+    
+    def clear_cache(self) -> None:
+        """Drop all in-memory cached market data responses."""
+        self._market_data_cache.clear()
+    
+    def _remember(self, cache_key: tuple, response: MarketDataResponse) -> None:
+        """Store a copy of a response in the in-memory LRU cache."""
+        self._market_data_cache[cache_key] = replace(response, data=list(response.data))
+        self._market_data_cache.move_to_end(cache_key)
+        if len(self._market_data_cache) > MARKET_DATA_CACHE_SIZE:
+            self._market_data_cache.popitem(last=False)
+    
+    @staticmethod
+    def _is_completed_range(end_date) -> bool:
+        """True if the requested range ended before today (its data can no longer change)."""
+        if isinstance(end_date, datetime):
+            end_day = end_date.date()
+        else:
+            try:
+                end_day = datetime.strptime(str(end_date)[:10], '%Y-%m-%d').date()
+            except ValueError:
+                return False
+        return end_day < datetime.now().date()
+    
+    @staticmethod
+    def _disk_cache_path(cache_key: tuple) -> Path:
+        digest = hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()
+        return MARKET_DATA_CACHE_DIR / f"{digest}.pkl"
+    
+    def _load_disk_cache(self, cache_key: tuple) -> Optional[MarketDataResponse]:
+        """Load a cached response from disk, or None if missing/unreadable."""
+        if not MARKET_DATA_DISK_CACHE_ENABLED:
+            return None
+        
+        path = self._disk_cache_path(cache_key)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable market data cache file {path}: {e}")
+            return None
+    
+    def _save_disk_cache(self, cache_key: tuple, response: MarketDataResponse) -> None:
+        """Write a response to the disk cache (atomically, so parallel workers never see partial files)."""
+        if not MARKET_DATA_DISK_CACHE_ENABLED:
+            return
+        
+        path = self._disk_cache_path(cache_key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(response, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write market data cache file {path}: {e}")
+    
+    async def _fetch_market_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_tick_data: bool = False,
+        **kwargs
+    ) -> MarketDataResponse:
+        """Fetch market data from the VPS API (uncached)."""
         import sys
         print(f"🔥 DATA CONNECTOR CALLED: use_tick_data={use_tick_data}", file=sys.stderr, flush=True)
         logger.info(f"📊 get_market_data called: {symbol} {timeframe} from {start_date} to {end_date}")
@@ -572,4 +698,23 @@ class DataConnector:
             "status": "disconnected", 
             "api_server": False,
             "message": "❌ API Server on port 8000 not responding"
-        }
\ No newline at end of file
+        }
+
+
+# Global connector instance
+_global_data_connector = None
+
+def get_data_connector() -> DataConnector:
+    """
+    Get the global data connector instance.
+    
+    Sharing one connector lets repeated backtests in the same process reuse
+    its market data cache.
+    
+    Returns:
+        Global DataConnector instance
+    """
+    global _global_data_connector
+    if _global_data_connector is None:
+        _global_data_connector = DataConnector()
+    return _global_data_connector
@@ -0,0 +1,21 @@
+"""
+Calendar helpers shared by the backtest scripts.
+"""
+
+from datetime import date
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+
+def get_weekdays_in_range(start_date, end_date,
+                          holidays: Optional[Iterable[date]] = None) -> List[date]:
+    """Get all weekdays (Mon-Fri) between start and end dates, inclusive.
+
+    Dates listed in ``holidays`` (e.g. exchange closures) are skipped as well.
+    """
+    if holidays:
+        days = pd.bdate_range(start_date, end_date, freq='C', holidays=list(holidays))
+    else:
+        days = pd.bdate_range(start_date, end_date)
+    return list(days.date)
@@ -18,12 +18,14 @@ class _NullPrint:
 # Replace print globally in this module to prevent MCP protocol corruption
 print = _NullPrint()
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from shared.models import Candle  
 from shared.strategy_interface import IndicatorCalculator
+from shared._stoch_jit import stoch_kd
 
 
 class VWAPCalculator(IndicatorCalculator):
@@ -40,8 +42,9 @@ class VWAPCalculator(IndicatorCalculator):
     def requires_periods(self) -> int:
         return 1  # VWAP can be calculated from first candle
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("VWAP")
     
@@ -89,8 +92,9 @@ class SMACalculator(IndicatorCalculator):
     def requires_periods(self) -> int:
         return self.period
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("SMA")
     
@@ -136,8 +140,9 @@ class EMACalculator(IndicatorCalculator):
     def requires_periods(self) -> int:
         return self.period
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("EMA")
     
@@ -181,8 +186,9 @@ class RSICalculator(IndicatorCalculator):
     def requires_periods(self) -> int:
         return self.period + 1  # Need one extra for price change calculation
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("RSI")
     
@@ -303,8 +309,9 @@ class MACDCalculator(IndicatorCalculator):
         # Need enough data for slow EMA + signal EMA
         return self.slow_period + self.signal_period
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("MACD")
     
@@ -396,11 +403,23 @@ class StochasticCalculator(IndicatorCalculator):
         # Need k_period + max(k_smoothing, d_smoothing) for full calculation
         return self.k_period + max(self.k_smoothing, self.d_smoothing)
     
-    def get_chart_config(self):
-        """Return chart configuration metadata."""
+    @classmethod
+    def get_chart_config(cls):
+        """Return chart configuration metadata (the same for every instance)."""
         from shared.indicators_metadata import metadata_registry
         return metadata_registry.get("STOCHASTIC")
     
+    def calculate_arrays(self, highs, lows, closes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate %K and %D directly from price arrays.
+        
+        Returns two arrays the same length as the inputs, clamped to 0-100
+        and NaN until enough bars are available for each line.
+        """
+        k_line, d_line = stoch_kd(np.asarray(highs), np.asarray(lows), np.asarray(closes),
+                                  self.k_period, self.k_smoothing, self.d_smoothing)
+        return np.clip(k_line, 0.0, 100.0), np.clip(d_line, 0.0, 100.0)
+    
     def calculate(self, candles: List[Candle], **kwargs) -> Dict[datetime, float]:
         """
         Calculate Stochastic Oscillator.
@@ -411,51 +430,19 @@ class StochasticCalculator(IndicatorCalculator):
         if len(candles) < self.k_period:
             return {}
         
-        results = {}
-        
-        # Convert to pandas for easier calculation
-        df = pd.DataFrame([
-            {
-                'timestamp': c.timestamp,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close
-            }
-            for c in candles
-        ])
-        
-        # Calculate raw %K
-        df['lowest_low'] = df['low'].rolling(window=self.k_period).min()
-        df['highest_high'] = df['high'].rolling(window=self.k_period).max()
-        
-        # Handle division by zero (when high == low)
-        df['range'] = df['highest_high'] - df['lowest_low']
-        df['range'] = df['range'].replace(0, 1e-10)  # Avoid division by zero
-        
-        df['k_raw'] = ((df['close'] - df['lowest_low']) / df['range']) * 100
+        count = len(candles)
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=count)
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=count)
+        closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=count)
+        k_line, d_line = self.calculate_arrays(highs, lows, closes)
         
-        # Apply %K smoothing if needed
-        if self.k_smoothing > 1:
-            df['k'] = df['k_raw'].rolling(window=self.k_smoothing).mean()
-        else:
-            df['k'] = df['k_raw']
-        
-        # Calculate %D (signal line)
-        df['d'] = df['k'].rolling(window=self.d_smoothing).mean()
+        # Keep only bars where both lines are defined (%D starts last)
+        valid = np.flatnonzero(~np.isnan(d_line)).tolist()
+        timestamps = [candles[i].timestamp for i in valid]
+        results = dict(zip(timestamps, k_line[valid].tolist()))
         
         # Store %D line for later retrieval
-        self._d_line = {}
-        
-        # Convert back to dictionary, skipping NaN values
-        for _, row in df.iterrows():
-            if pd.notna(row['k']) and pd.notna(row['d']):
-                timestamp = row['timestamp']
-                # Clamp values to 0-100 range
-                k_value = max(0.0, min(100.0, float(row['k'])))
-                d_value = max(0.0, min(100.0, float(row['d'])))
-                
-                results[timestamp] = k_value
-                self._d_line[timestamp] = d_value
+        self._d_line = dict(zip(timestamps, d_line[valid].tolist()))
         
         return results
     
@@ -66,6 +66,8 @@ class IndicatorMetadataRegistry:
     
     def __init__(self):
         self._metadata: Dict[str, IndicatorMetadata] = {}
+        # Bumped on every registration so callers can cache lookups per version
+        self.version = 0
         self._register_default_metadata()
     
     def _register_default_metadata(self):
@@ -191,6 +193,7 @@ class IndicatorMetadataRegistry:
         
         # Register the validated metadata
         self._metadata[metadata.name] = metadata
+        self.version += 1
         logger.info(f"Registered metadata for indicator: {metadata.name} (type: {metadata.indicator_type.value}, scale: {metadata.scale_type.value})")
     
     def get(self, indicator_name: str) -> Optional[IndicatorMetadata]:
@@ -39,6 +39,39 @@ class Candle(BaseModel):
     low: float
     close: float
     volume: Optional[float] = None
+    
+    @classmethod
+    def from_arrays(cls, timestamps, opens, highs, lows, closes, volumes=None) -> List["Candle"]:
+        """
+        Build candles from parallel column sequences (lists or NumPy arrays).
+        
+        Values are coerced to the field types up front and the candles are
+        constructed without per-row validation. Timestamps may be datetime
+        objects or a datetime64 array (converted to naive datetimes).
+        """
+        def as_list(values):
+            return values.tolist() if hasattr(values, 'tolist') else list(values)
+        
+        def as_floats(values):
+            return [None if v is None else float(v) for v in as_list(values)]
+        
+        def as_datetimes(values):
+            if getattr(getattr(values, 'dtype', None), 'kind', None) == 'M':
+                import numpy as np
+                # datetime64[ns].tolist() gives ints; microseconds give datetimes
+                return np.asarray(values).astype('datetime64[us]').tolist()
+            return as_list(values)
+        
+        columns = [as_datetimes(timestamps), as_floats(opens), as_floats(highs), as_floats(lows), as_floats(closes)]
+        if volumes is None:
+            return [
+                cls.model_construct(timestamp=t, open=o, high=h, low=l, close=c)
+                for t, o, h, l, c in zip(*columns)
+            ]
+        return [
+            cls.model_construct(timestamp=t, open=o, high=h, low=l, close=c, volume=v)
+            for t, o, h, l, c, v in zip(*columns, as_floats(volumes))
+        ]
 
 
 class Trade(BaseModel):
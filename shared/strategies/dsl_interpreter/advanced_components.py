@@ -12,23 +12,14 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+from .debug_log import get_diagnostic_logger as _get_diagnostic_logger
+
 logger = logging.getLogger(__name__)
 
 # Use diagnostic logger for detailed debugging
-DEBUG_LOG_PATH = '/tmp/dsl_debug.log'
-
 def get_diagnostic_logger():
     """Get the diagnostic logger for detailed debugging."""
-    diag_logger = logging.getLogger('dsl_diagnostic_advanced')
-    if not diag_logger.handlers:
-        diag_logger.setLevel(logging.DEBUG)
-        fh = logging.FileHandler(DEBUG_LOG_PATH, mode='a')
-        fh.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        fh.setFormatter(formatter)
-        diag_logger.addHandler(fh)
-        diag_logger.propagate = False
-    return diag_logger
+    return _get_diagnostic_logger('dsl_diagnostic_advanced')
 
 diagnostic_logger = get_diagnostic_logger()
 
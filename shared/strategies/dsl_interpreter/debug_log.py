@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+DSL Diagnostic Log
+
+Shared setup for the DSL interpreter's diagnostic loggers. Every logger
+writes through one FileHandler on DEBUG_LOG_PATH (a single open stream,
+rather than reopening the file per message).
+
+Tests that need to inspect what was logged can call attach_debug_sink() to
+also collect messages in the in-memory ring buffer ``debug_sink``; it is
+off by default, so production runs keep nothing in memory.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Set
+
+DEBUG_LOG_PATH = '/tmp/dsl_debug.log'
+
+# Most recent diagnostic messages, oldest dropped first (only filled while
+# the sink is attached)
+debug_sink: deque = deque(maxlen=200000)
+
+_file_handler = None
+_sink_attached = False
+_diagnostic_loggers: Set[str] = set()
+
+
+class _SinkHandler(logging.Handler):
+    """Append each record's message to debug_sink."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        debug_sink.append(record.getMessage())
+
+
+_sink_handler = _SinkHandler()
+
+
+def _get_file_handler() -> logging.FileHandler:
+    global _file_handler
+    if _file_handler is None:
+        _file_handler = logging.FileHandler(DEBUG_LOG_PATH, mode='a')
+        _file_handler.setLevel(logging.DEBUG)
+        _file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s | %(levelname)s | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+    return _file_handler
+
+
+def get_diagnostic_logger(name: str) -> logging.Logger:
+    """
+    Get a DSL diagnostic logger writing to the shared log file.
+
+    Safe to call repeatedly; handlers are only attached once per logger.
+    """
+    diag_logger = logging.getLogger(name)
+    if not diag_logger.handlers:
+        diag_logger.setLevel(logging.DEBUG)
+        diag_logger.addHandler(_get_file_handler())
+        if _sink_attached:
+            diag_logger.addHandler(_sink_handler)
+        diag_logger.propagate = False  # Don't propagate to root logger
+    _diagnostic_loggers.add(name)
+    return diag_logger
+
+
+def attach_debug_sink() -> deque:
+    """
+    Start collecting diagnostic messages in debug_sink.
+
+    Applies to existing diagnostic loggers and ones created later. The sink
+    is not cleared; callers clear it when they want a fresh capture.
+    """
+    global _sink_attached
+    _sink_attached = True
+    for name in _diagnostic_loggers:
+        diag_logger = logging.getLogger(name)
+        if _sink_handler not in diag_logger.handlers:
+            diag_logger.addHandler(_sink_handler)
+    return debug_sink
+
+
+def detach_debug_sink() -> None:
+    """Stop collecting diagnostic messages in debug_sink."""
+    global _sink_attached
+    _sink_attached = False
+    for name in _diagnostic_loggers:
+        logging.getLogger(name).removeHandler(_sink_handler)
+
+
+def count_debug_messages(*markers: str) -> Dict[str, int]:
+    """Count occurrences of each marker string in one pass over debug_sink."""
+    counts = dict.fromkeys(markers, 0)
+    for message in debug_sink:
+        for marker in markers:
+            counts[marker] += message.count(marker)
+    return counts
@@ -18,6 +18,9 @@ import os
 from shared.strategy_interface import TradingStrategy
 from .dsl_strategy import DSLStrategy, create_dsl_strategy_from_file
 from .schema_validator import validate_dsl_file, DSLValidationError
+from .debug_log import get_diagnostic_logger
+
+diagnostic_logger = get_diagnostic_logger('dsl_diagnostic')
 
 
 class DSLLoader:
@@ -331,8 +334,7 @@ def integrate_dsl_with_strategy_registry(strategy_registry, dsl_loader: DSLLoade
                     signal = self._dsl_strategy.generate_signal(context)
                     # DEBUG: Log wrapper signal forwarding
                     if signal:
-                        with open('/tmp/dsl_debug.log', 'a') as f:
-                            f.write(f"WRAPPER FORWARDING SIGNAL: {signal.direction} @ {signal.price}\n")
+                        diagnostic_logger.debug(f"WRAPPER FORWARDING SIGNAL: {signal.direction} @ {signal.price}")
                     return signal
                 
                 def initialize(self, parameters: Dict[str, Any] = None) -> None:
@@ -346,12 +348,7 @@ def integrate_dsl_with_strategy_registry(strategy_registry, dsl_loader: DSLLoade
                     return self._dsl_strategy.on_trade_closed(trade, context)
                 
                 def on_candle_processed(self, context) -> None:
-                    # CRITICAL DEBUG
-                    try:
-                        with open('/tmp/dsl_debug.log', 'a') as f:
-                            f.write(f"WRAPPER on_candle_processed called at {context.current_candle.timestamp}\n")
-                    except:
-                        pass
+                    diagnostic_logger.debug(f"WRAPPER on_candle_processed called at {context.current_candle.timestamp}")
                     return self._dsl_strategy.on_candle_processed(context)
                 
                 def get_indicator_series(self, candles):
@@ -20,39 +20,13 @@ from pathlib import Path
 from shared.models import Candle, TradeDirection
 from shared.strategy_interface import TradingStrategy, StrategyContext, Signal, SignalStrength
 from .schema_validator import validate_dsl_strategy, DSLValidationError
+from .debug_log import DEBUG_LOG_PATH, get_diagnostic_logger
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Configure diagnostic logging
-DEBUG_LOG_PATH = '/tmp/dsl_debug.log'
-
-def setup_diagnostic_logger():
-    """Set up file-based diagnostic logger for DSL strategy debugging."""
-    logger = logging.getLogger('dsl_diagnostic')
-    logger.setLevel(logging.DEBUG)
-    
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
-    
-    # Create file handler
-    fh = logging.FileHandler(DEBUG_LOG_PATH, mode='a')
-    fh.setLevel(logging.DEBUG)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    fh.setFormatter(formatter)
-    
-    logger.addHandler(fh)
-    logger.propagate = False  # Don't propagate to root logger
-    
-    return logger
-
-# Initialize diagnostic logger
-diagnostic_logger = setup_diagnostic_logger()
+# Diagnostic logging (shared log file plus in-memory sink)
+diagnostic_logger = get_diagnostic_logger('dsl_diagnostic')
 
 
 class DSLStrategy(TradingStrategy):
@@ -1153,14 +1127,6 @@ class DSLStrategy(TradingStrategy):
     
     def on_candle_processed(self, context: StrategyContext) -> None:
         """Called after each candle is processed."""
-        # CRITICAL DEBUG: Write to separate file
-        try:
-            with open('/tmp/dsl_candle_debug.txt', 'a') as f:
-                f.write(f"CANDLE PROCESSED: {context.current_candle.timestamp}\n")
-                f.flush()
-        except:
-            pass
-        
         diagnostic_logger.debug(f"!!! on_candle_processed CALLED at {context.current_candle.timestamp} !!!")
         
         current_date = context.current_candle.timestamp.date()
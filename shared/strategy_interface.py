@@ -9,6 +9,7 @@ Phase 1 of gradual migration - new interfaces alongside existing code.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, time
 from dataclasses import dataclass
@@ -45,6 +46,45 @@ class Signal:
             self.metadata = {}
 
 
+class CandleHistoryView(Sequence):
+    """
+    Read-only view of the first ``end`` candles of a candle list.
+    
+    Lets the backtest loop hand strategies the history up to the current
+    candle without copying the list on every iteration. Slicing returns a
+    plain list, so ``historical_candles[-n:]`` behaves exactly as before.
+    """
+    
+    __slots__ = ("_candles", "_end")
+    
+    def __init__(self, candles: List[Candle], end: int):
+        self._candles = candles
+        self._end = end
+    
+    def __len__(self) -> int:
+        return self._end
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._end)
+            if step > 0:
+                return self._candles[start:stop:step]
+            return [self._candles[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("candle history index out of range")
+        return self._candles[index]
+    
+    def __iter__(self):
+        candles = self._candles
+        for i in range(self._end):
+            yield candles[i]
+    
+    def __repr__(self) -> str:
+        return f"CandleHistoryView(len={self._end})"
+
+
 @dataclass
 class StrategyContext:
     """
@@ -54,7 +94,7 @@ class StrategyContext:
     might need to make decisions.
     """
     current_candle: Candle
-    historical_candles: List[Candle]
+    historical_candles: Sequence[Candle]  # a list or a CandleHistoryView
     indicators: Dict[str, float]  # Pre-calculated indicators (VWAP, SMA, etc.)
     current_position: Optional['Trade'] = None
     market_session: str = "unknown"  # "london", "new_york", etc.
@@ -67,7 +107,7 @@ class StrategyContext:
     
     def get_previous_candles(self, count: int) -> List[Candle]:
         """Get the last N candles from history."""
-        return self.historical_candles[-count:] if count <= len(self.historical_candles) else self.historical_candles
+        return self.historical_candles[-count:] if count <= len(self.historical_candles) else list(self.historical_candles)
 
 
 @dataclass